@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pydantic import BaseModel
 
 def _env(key: str, default: str) -> str:
@@ -11,5 +12,29 @@ class Settings(BaseModel):
     session_cookie: str = _env("SESSION_COOKIE", "taskmgr_session")
     admin_username: str = _env("ADMIN_USERNAME", "admin")
     admin_password: str = _env("ADMIN_PASSWORD", "admin123")
+    task_page_size: int = int(_env("TASK_PAGE_SIZE", "50"))
+    task_count_cache_seconds: int = int(_env("TASK_COUNT_CACHE_SECONDS", "30"))
+    export_batch_size: int = int(_env("EXPORT_BATCH_SIZE", "500"))
+    export_spool_max_bytes: int = int(_env("EXPORT_SPOOL_MAX_BYTES", str(8 * 1024 * 1024)))
+    export_workers: int = int(_env("EXPORT_WORKERS", "2"))
+    export_jobs_per_user: int = int(_env("EXPORT_JOBS_PER_USER", "2"))
+    export_ttl_seconds: int = int(_env("EXPORT_TTL_SECONDS", "3600"))
+    export_dir: str = _env(
+        "EXPORT_DIR",
+        os.path.join(tempfile.gettempdir(), "taskmanager-exports")
+    )
+    export_cache_dir: str = _env(
+        "EXPORT_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "taskmanager-export-cache")
+    )
+    export_cache_ttl_seconds: int = int(_env("EXPORT_CACHE_TTL_SECONDS", "86400"))
+    argon2_time_cost: int = int(_env("ARGON2_TIME_COST", "3"))
+    argon2_memory_cost: int = int(_env("ARGON2_MEMORY_COST", "65536"))
+    argon2_parallelism: int = int(_env("ARGON2_PARALLELISM", "4"))
+    password_hash_workers: int = int(_env("PASSWORD_HASH_WORKERS", "2"))
+    password_hash_queue: int = int(_env("PASSWORD_HASH_QUEUE", "16"))
+    bulk_task_limit: int = int(_env("BULK_TASK_LIMIT", "500"))
+    principal_cache_size: int = int(_env("PRINCIPAL_CACHE_SIZE", "1024"))
+    password_hash_timeout_seconds: float = float(_env("PASSWORD_HASH_TIMEOUT_SECONDS", "5"))
 
 settings = Settings()
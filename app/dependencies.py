@@ -1,7 +1,7 @@
 from fastapi import Request, Depends
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
-from app.models.user import User
+from app.utils.principal_cache import Principal, get_principal
 
 def get_db():
     db = SessionLocal()
@@ -10,11 +10,17 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> Principal | None:
+    """
+    The cached principal for the session's user (see
+    app/utils/principal_cache.py): a detached stand-in for User with the
+    fields permission checks and templates read, not an ORM instance.
+    None when nobody is signed in or the user is inactive.
+    """
     user_id = request.session.get("user_id")
     if not user_id:
         return None
-    return db.get(User, user_id)
+    return get_principal(db, user_id)
 from app.models.task_type import TaskType
 from app.models.user import User
 
@@ -6,8 +6,8 @@ from sqlalchemy.orm import Session
 from app.config import settings
 from app.database import engine, Base
 from sqlalchemy import inspect, text
-from app.dependencies import get_db
 from app.ui import templates
+from app.middleware import ReportFilterMiddleware
 
 # Routers
 from app.routes import auth
@@ -17,6 +17,7 @@ from app.routes import user_pages
 from app.routes import task_type_pages
 from app.routes import quick_tasks
 from app.routes import admin_pages
+from app.routes import search_pages
 
 # Models
 from app.models.user import User
@@ -24,10 +25,17 @@ from app.models.task_type import TaskType
 from app.models.privilege import Privilege
 from app.models.quick_task import QuickTask
 from app.models.app_setting import AppSetting
-from app.utils.theme import BUTTON_COLOR_DEFAULTS, sanitize_hex_color
+from app.models.user_hierarchy import UserHierarchy
+from app.services.hierarchy_service import rebuild_hierarchy
+from app.services.search_service import get_search_backend
+from app.services.milestone_service import sync_milestone_counters
+from app.services.export_jobs import cleanup_expired_exports, shutdown_export_workers
+from app.services.export_cache import DATA_VERSION_KEY
+from app.utils.theme import BUTTON_COLOR_DEFAULTS
 
 # Security
-from app.utils.security import hash_password
+from app.utils.security import hash_password, shutdown_password_hashing
+from app.utils.privileges import bump_privilege_map
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse
 from starlette.middleware.sessions import SessionMiddleware
@@ -63,6 +71,7 @@ Base.metadata.create_all(bind=engine)
 # LIGHTWEIGHT SCHEMA UPDATES (SQLITE/DEV SAFE)
 # =====================================================
 inspector = inspect(engine)
+backfill_milestone_counters = False
 if "tasks" in inspector.get_table_names():
     task_cols = {c["name"] for c in inspector.get_columns("tasks")}
     with engine.begin() as conn:
@@ -82,55 +91,41 @@ if "tasks" in inspector.get_table_names():
             conn.execute(
                 text("ALTER TABLE tasks ADD COLUMN submitted_at DATETIME")
             )
+        if "milestone_total" not in task_cols:
+            conn.execute(text(
+                "ALTER TABLE tasks ADD COLUMN milestone_total INTEGER NOT NULL DEFAULT 0"
+            ))
+            conn.execute(text(
+                "ALTER TABLE tasks ADD COLUMN milestone_completed INTEGER NOT NULL DEFAULT 0"
+            ))
+            conn.execute(text(
+                "ALTER TABLE tasks ADD COLUMN next_milestone_deadline DATE"
+            ))
+            conn.execute(text(
+                "ALTER TABLE tasks ADD COLUMN max_sequence INTEGER NOT NULL DEFAULT 0"
+            ))
+            backfill_milestone_counters = True
+
+if backfill_milestone_counters:
+    with Session(engine) as db:
+        sync_milestone_counters(db)
+        db.commit()
+
+# create_all() only adds indexes alongside new tables; add any missing
+# ones to existing tables (CREATE INDEX is skipped when already present).
+with engine.begin() as conn:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+# Full-text search index and the triggers that keep it in sync
+get_search_backend(engine).install(engine)
 
 
 # =====================================================
 # GLOBAL TEMPLATE DATA (REPORT FILTERS)
 # =====================================================
-@app.middleware("http")
-async def inject_report_filters(request: Request, call_next):
-    response = None
-    db: Session | None = None
-
-    try:
-        db = next(get_db())
-        request.state.task_types = (
-            db.query(TaskType)
-            .filter(TaskType.is_active == True)
-            .all()
-        )
-        request.state.users = (
-            db.query(User)
-            .filter(User.is_active == True)
-            .all()
-        )
-        theme_setting = (
-            db.query(AppSetting)
-            .filter(AppSetting.key == "ui_theme")
-            .first()
-        )
-        request.state.ui_theme = (
-            theme_setting.value
-            if theme_setting and theme_setting.value
-            else "classic"
-        )
-        button_settings = (
-            db.query(AppSetting)
-            .filter(AppSetting.key.in_(list(BUTTON_COLOR_DEFAULTS.keys())))
-            .all()
-        )
-        button_map = {item.key: item.value for item in button_settings}
-        request.state.ui_button_colors = {
-            key: sanitize_hex_color(button_map.get(key), default)
-            for key, default in BUTTON_COLOR_DEFAULTS.items()
-        }
-
-        response = await call_next(request)
-    finally:
-        if db:
-            db.close()
-
-    return response
+app.add_middleware(ReportFilterMiddleware)
 
 
 # =====================================================
@@ -144,6 +139,25 @@ app.include_router(task_type_pages.router)
 app.include_router(dashboard.router)
 app.include_router(quick_tasks.router)
 app.include_router(admin_pages.router)
+app.include_router(search_pages.router)
+
+
+# =====================================================
+# BACKGROUND EXPORT WORKERS
+# =====================================================
+@app.on_event("startup")
+def purge_stale_exports():
+    cleanup_expired_exports()
+
+
+@app.on_event("shutdown")
+def stop_export_workers():
+    shutdown_export_workers()
+
+
+@app.on_event("shutdown")
+def stop_password_hashing():
+    shutdown_password_hashing()
 
 
 # =====================================================
@@ -187,6 +201,7 @@ with Session(engine) as db:
         for code, desc in default_privs:
             db.add(Privilege(code=code, description=desc))
         db.commit()
+        bump_privilege_map()
 
     if not db.query(AppSetting).filter(AppSetting.key == "ui_theme").first():
         db.add(AppSetting(key="ui_theme", value="classic"))
@@ -196,3 +211,12 @@ with Session(engine) as db:
         if not db.query(AppSetting).filter(AppSetting.key == key).first():
             db.add(AppSetting(key=key, value=default))
     db.commit()
+
+    # Stamp replaced on every task/milestone/quick-log write (export cache)
+    if not db.query(AppSetting).filter(AppSetting.key == DATA_VERSION_KEY).first():
+        db.add(AppSetting(key=DATA_VERSION_KEY, value="1"))
+        db.commit()
+
+    # Populate the org-hierarchy closure table for existing databases
+    if not db.query(UserHierarchy).first():
+        rebuild_hierarchy(db)
@@ -0,0 +1,47 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.database import SessionLocal
+from app.utils.ui_cache import get_filter_lookups, get_theme_settings
+
+
+# request.state attribute -> loader returning the dict that holds it
+LAZY_STATE_LOADERS = {
+    "task_types": get_filter_lookups,
+    "users": get_filter_lookups,
+    "ui_theme": get_theme_settings,
+    "ui_button_colors": get_theme_settings,
+}
+
+
+class LazyRequestState(dict):
+    """
+    Backing dict for `request.state` that resolves the shared template
+    lookups on first read. Routes that never touch them pay nothing.
+    """
+
+    def __missing__(self, key):
+        loader = LAZY_STATE_LOADERS.get(key)
+        if loader is None:
+            raise KeyError(key)
+
+        data = loader(SessionLocal)
+        for name, value in data.items():
+            self.setdefault(name, value)
+        return self[key]
+
+
+class ReportFilterMiddleware:
+    """
+    Pure ASGI replacement for the old `@app.middleware("http")` injector.
+    It only swaps in a lazy state dict, so it adds no response wrapping
+    and no DB work to static files, redirects or downloads.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            scope["state"] = LazyRequestState(scope.get("state") or {})
+
+        await self.app(scope, receive, send)
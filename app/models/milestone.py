@@ -1,4 +1,4 @@
-from sqlalchemy import String, Date, ForeignKey, Integer, DateTime
+from sqlalchemy import String, Date, ForeignKey, Integer, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date
 from app.database import Base
@@ -16,3 +16,10 @@ class TaskMilestone(Base):
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
     task = relationship("Task", back_populates="milestones")
+
+    __table_args__ = (
+        # Per-task loads ordered by sequence, and sequence swaps
+        Index("ix_task_milestones_task_sequence", "task_id", "sequence"),
+        # Dashboard today/upcoming/overdue buckets
+        Index("ix_task_milestones_deadline_status", "deadline", "status"),
+    )
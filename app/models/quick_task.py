@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, DateTime, ForeignKey
+from sqlalchemy import String, Date, DateTime, ForeignKey, Index
 from datetime import datetime, date
 
 from app.database import Base
@@ -17,3 +17,9 @@ class QuickTask(Base):
     created_by = relationship("User")
 
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+    __table_args__ = (
+        # Per-user quick log list and report filters by date
+        Index("ix_quick_tasks_creator_completed", "created_by_id", "completed_on"),
+        Index("ix_quick_tasks_completed_on", "completed_on"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Date, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import String, Date, Boolean, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date
 
@@ -64,3 +64,46 @@ class Task(Base):
         cascade="all, delete-orphan",
         order_by="TaskMilestone.sequence"
     )
+
+    # Maintained by milestone_service.sync_milestone_counters so lists and
+    # auto-completion never need the milestone rows themselves.
+    milestone_total: Mapped[int] = mapped_column(default=0, server_default="0")
+    milestone_completed: Mapped[int] = mapped_column(default=0, server_default="0")
+    next_milestone_deadline: Mapped[date | None] = mapped_column(Date, nullable=True)
+    max_sequence: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    # -----------------
+    # Indexes
+    # -----------------
+    # Every hot query filters archived = false; partial indexes keep the
+    # archived history out of them entirely.
+    __table_args__ = (
+        # Keyset order for task/report lists and the admin dashboard
+        Index(
+            "ix_tasks_live_deadline_id",
+            "final_deadline", "id",
+            sqlite_where=text("archived = 0"),
+            postgresql_where=text("archived = false")
+        ),
+        # Visibility scoping (own tasks / subordinate reviews)
+        Index(
+            "ix_tasks_live_assignee_status_deadline",
+            "assigned_to_id", "status", "final_deadline",
+            sqlite_where=text("archived = 0"),
+            postgresql_where=text("archived = false")
+        ),
+        # Status filters, pending-review lists and KPI GROUP BY status
+        Index(
+            "ix_tasks_live_status_deadline",
+            "status", "final_deadline",
+            sqlite_where=text("archived = 0"),
+            postgresql_where=text("archived = false")
+        ),
+        # Weekly completion series in report analytics
+        Index(
+            "ix_tasks_live_completed_at",
+            "completed_at",
+            sqlite_where=text("archived = 0"),
+            postgresql_where=text("archived = false")
+        ),
+    )
@@ -23,7 +23,8 @@ class User(Base):
     # =========================
     manager_id: Mapped[int | None] = mapped_column(
         ForeignKey("users.id"),
-        nullable=True
+        nullable=True,
+        index=True
     )
     privileges = relationship(
         "Privilege",
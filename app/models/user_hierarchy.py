@@ -0,0 +1,26 @@
+from sqlalchemy import ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class UserHierarchy(Base):
+    """
+    Closure table of the manager tree: one row per (ancestor, descendant)
+    pair, including a depth-0 row for every user.
+    """
+    __tablename__ = "user_hierarchy"
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_user_hierarchy_descendant", "descendant_id", "ancestor_id"),
+    )
@@ -7,6 +7,8 @@ from app.ui import templates
 from app.models.user import User
 from app.models.app_setting import AppSetting
 from app.utils.theme import BUTTON_COLOR_DEFAULTS, sanitize_hex_color
+from app.utils.ui_cache import bump_version
+from app.services.dashboard_cache import cache_stats
 
 router = APIRouter(prefix="/ui/admin")
 
@@ -113,4 +115,13 @@ def theme_settings_submit(
             color_setting.value = color_value
 
     db.commit()
+    bump_version()
     return RedirectResponse("/ui/admin/theme", status_code=303)
+
+
+@router.get("/cache-stats")
+def cache_stats_view(user: User = Depends(get_current_user)):
+    if not user or user.role != "admin":
+        return RedirectResponse("/dashboard", status_code=303)
+
+    return {"dashboard": cache_stats()}
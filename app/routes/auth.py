@@ -2,26 +2,30 @@ from fastapi import APIRouter, Request, Form, Depends
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from app.services.auth_service import authenticate_user
+from app.utils.security import PasswordHashBusy
 from app.dependencies import get_db
 from app.ui import templates
 
 router = APIRouter()
 
 @router.get("/login")
-def login_page(request: Request, error: int | None = None):
+def login_page(request: Request, error: str | None = None):
     return templates.TemplateResponse(
         "login.html",
         {"request": request, "error": error}
     )
 
 @router.post("/login")
-def login(
+async def login(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
     db: Session = Depends(get_db)
 ):
-    user = authenticate_user(db, username, password)
+    try:
+        user = await authenticate_user(db, username, password)
+    except PasswordHashBusy:
+        return RedirectResponse("/login?error=busy", status_code=303)
     if not user:
         return RedirectResponse("/login?error=1", status_code=303)
 
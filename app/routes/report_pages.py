@@ -1,31 +1,40 @@
-from fastapi import APIRouter, Depends, Query, Request, HTTPException
-from fastapi.responses import StreamingResponse, RedirectResponse
+from fastapi import APIRouter, Depends, Form, Query, Request, HTTPException
+from fastapi.responses import FileResponse, Response, StreamingResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from datetime import date
 from math import ceil
-from types import SimpleNamespace
+from urllib.parse import urlencode
 
 from app.dependencies import get_db, get_current_user
 from app.ui import templates
-from app.models.task import Task
-from app.models.quick_task import QuickTask
 from app.models.user import User
-from app.services.report_service import generate_tasks_excel, generate_tasks_pdf
+from app.services.report_service import (
+    EXPORT_COLUMNS,
+    generate_tasks_excel,
+    generate_tasks_pdf,
+    report_filters,
+    report_page,
+    stream_tasks_csv,
+    stream_tasks_ndjson
+)
+from app.services.analytics_service import DEFAULT_WEEKS, GROUPINGS, task_analytics
+from app.services.export_cache import (
+    etag_for,
+    etag_matches,
+    export_cache_key,
+    get_or_build_export
+)
+from app.services.export_jobs import (
+    EXPORT_FORMATS,
+    ExportLimitReached,
+    get_export_job,
+    job_status,
+    submit_export
+)
 
 router = APIRouter(prefix="/ui/reports")
 
-DEFAULT_COLUMNS = [
-    "id",
-    "title",
-    "status",
-    "priority",
-    "assigned_to",
-    "deadline",
-    "folder",
-    "milestone",
-    "milestone_status",
-    "milestone_deadline",
-]
+DEFAULT_COLUMNS = EXPORT_COLUMNS
 
 def _parse_date(value: str | None) -> date | None:
     if value is None:
@@ -39,19 +48,43 @@ def _parse_date(value: str | None) -> date | None:
         raise HTTPException(status_code=400, detail="Invalid date format") from exc
 
 
+def _parse_id(value: str | None) -> int | None:
+    # "All" options in the filter form submit an empty string
+    if value is None or value.strip() == "":
+        return None
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid id") from exc
+
+
+def _report_filters(
+    status: str | None = None,
+    priority: str | None = None,
+    type_id: str | None = None,
+    assigned_to_id: str | None = None,
+    from_date: str | None = None,
+    to_date: str | None = None
+) -> dict:
+    """
+    The report filter set shared by the list page and every export.
+    """
+    return report_filters(
+        status=status,
+        priority=priority,
+        type_id=_parse_id(type_id),
+        assigned_to_id=_parse_id(assigned_to_id),
+        from_date=_parse_date(from_date),
+        to_date=_parse_date(to_date)
+    )
+
+
 @router.get("")
 def report_list(
     request: Request,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
-
-    # filters
-    status: str | None = None,
-    priority: str | None = None,
-    type_id: int | None = None,
-    assigned_to_id: int | None = None,
-    from_date: str | None = None,
-    to_date: str | None = None,
+    filters: dict = Depends(_report_filters),
     columns: list[str] | None = Query(None),
 
     # pagination
@@ -61,76 +94,17 @@ def report_list(
         return templates.TemplateResponse("login.html", {"request": request})
 
     PER_PAGE = 10
-    offset = (page - 1) * PER_PAGE
-
-    query = db.query(Task).filter(Task.archived == False)
-
-    # ================= APPLY FILTERS =================
-    if status:
-        query = query.filter(Task.status == status)
-
-    if priority:
-        query = query.filter(Task.priority == priority)
-
-    if type_id:
-        query = query.filter(Task.type_id == type_id)
-
-    if assigned_to_id:
-        query = query.filter(Task.assigned_to_id == assigned_to_id)
-
-    if from_date:
-        query = query.filter(Task.final_deadline >= from_date)
-
-    if to_date:
-        query = query.filter(Task.final_deadline <= to_date)
-
-    tasks = query.order_by(Task.final_deadline.asc()).all()
-
-    # Quick logs are treated as completed tasks in reports
-    quick_q = db.query(QuickTask)
-    if (status and status != "Completed") or priority or type_id:
-        quick_tasks = []
-    else:
-        if from_date:
-            quick_q = quick_q.filter(QuickTask.completed_on >= from_date)
-        if to_date:
-            quick_q = quick_q.filter(QuickTask.completed_on <= to_date)
-        if assigned_to_id:
-            quick_q = quick_q.filter(QuickTask.created_by_id == assigned_to_id)
-        quick_tasks = quick_q.all()
-
-    report_items = []
-
-    for t in tasks:
-        t.is_quick = False
-        t.url = f"/ui/tasks/{t.id}"
-        report_items.append(t)
-
-    for qt in quick_tasks:
-        report_items.append(
-            SimpleNamespace(
-                id=f"Q-{qt.id}",
-                title=qt.title,
-                status="Completed",
-                priority="Normal",
-                type=SimpleNamespace(name="Quick Log"),
-                assigned_to=qt.created_by,
-                final_deadline=qt.completed_on,
-                milestones=[],
-                folder_link=None,
-                is_quick=True,
-                url="/ui/quick-tasks"
-            )
-        )
-
-    report_items.sort(key=lambda x: x.final_deadline or date.min)
+    page = max(page, 1)
+
+    tasks, total = report_page(db, filters, page, PER_PAGE)
 
     if not columns:
         columns = DEFAULT_COLUMNS
 
-    total = len(report_items)
     total_pages = ceil(total / PER_PAGE) if total else 1
-    tasks = report_items[offset:offset + PER_PAGE]
+    page_query = urlencode(
+        [(k, v) for k, v in request.query_params.multi_items() if k != "page"]
+    )
 
     return templates.TemplateResponse(
         "reports/list.html",
@@ -141,28 +115,74 @@ def report_list(
 
             # filters (to persist UI state)
             "filters": {
-                "status": status,
-                "priority": priority,
-                "type_id": type_id,
-                "assigned_to_id": assigned_to_id,
-                "from_date": from_date,
-                "to_date": to_date,
+                **filters,
+                "from_date": filters["from_date"] or "",
+                "to_date": filters["to_date"] or "",
                 "columns": columns,
             },
 
             # pagination
             "page": page,
             "total_pages": total_pages,
-            "total": total
+            "total": total,
+            "page_query": page_query
         }
     )
 
 
+@router.get("/analytics")
+def report_analytics(
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+    filters: dict = Depends(_report_filters),
+    group_by: str = "assignee",
+    weeks: int = DEFAULT_WEEKS
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    if group_by not in GROUPINGS:
+        raise HTTPException(status_code=400, detail="Unknown grouping")
+    if not 1 <= weeks <= 104:
+        raise HTTPException(status_code=400, detail="weeks must be between 1 and 104")
+
+    return task_analytics(db, user, filters, group_by=group_by, weeks=weeks)
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def _cached_export(request: Request, db: Session, fmt: str, build, filters: dict, columns):
+    # The cache is shared by all users; safe only while exports are
+    # unscoped (see export_cache_key)
+    key = export_cache_key(db, fmt, filters, columns)
+    etag = etag_for(key)
+
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    spec = EXPORT_FORMATS[fmt]
+    path = get_or_build_export(
+        key,
+        spec["extension"],
+        lambda: build(db, filters, columns)
+    )
+    return FileResponse(
+        path,
+        media_type=spec["media_type"],
+        filename=f"tasks_report.{spec['extension']}",
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+    )
+
+
 @router.get("/tasks/excel")
 def export_tasks_excel(
-    from_date: str | None = Query(None),
-    to_date: str | None = Query(None),
-    status: str | None = Query(None),
+    request: Request,
+    filters: dict = Depends(_report_filters),
     columns: list[str] | None = Query(None),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -170,28 +190,54 @@ def export_tasks_excel(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    output = generate_tasks_excel(
-        db,
-        _parse_date(from_date),
-        _parse_date(to_date),
-        status,
-        columns
-    )
+    return _cached_export(request, db, "excel", generate_tasks_excel, filters, columns)
+
+
+@router.get("/tasks/pdf")
+def export_tasks_pdf(
+    request: Request,
+    filters: dict = Depends(_report_filters),
+    columns: list[str] | None = Query(None),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    return _cached_export(request, db, "pdf", generate_tasks_pdf, filters, columns)
+
+
+@router.get("/tasks/csv")
+def export_tasks_csv(
+    request: Request,
+    filters: dict = Depends(_report_filters),
+    columns: list[str] | None = Query(None),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    etag = etag_for(export_cache_key(db, "csv", filters, columns))
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
 
     return StreamingResponse(
-        output,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        stream_tasks_csv(filters, columns),
+        media_type="text/csv; charset=utf-8",
         headers={
-            "Content-Disposition": "attachment; filename=tasks_report.xlsx"
+            "Content-Disposition": "attachment; filename=tasks_report.csv",
+            "ETag": etag,
+            "Cache-Control": "private, no-cache"
         }
     )
 
 
-@router.get("/tasks/pdf")
-def export_tasks_pdf(
-    from_date: str | None = Query(None),
-    to_date: str | None = Query(None),
-    status: str | None = Query(None),
+@router.get("/tasks/ndjson")
+def export_tasks_ndjson(
+    request: Request,
+    filters: dict = Depends(_report_filters),
     columns: list[str] | None = Query(None),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
@@ -199,18 +245,79 @@ def export_tasks_pdf(
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    output = generate_tasks_pdf(
-        db,
-        _parse_date(from_date),
-        _parse_date(to_date),
-        status,
-        columns
-    )
+    etag = etag_for(export_cache_key(db, "ndjson", filters, columns))
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
 
     return StreamingResponse(
-        output,
-        media_type="application/pdf",
+        stream_tasks_ndjson(filters, columns),
+        media_type="application/x-ndjson",
         headers={
-            "Content-Disposition": "attachment; filename=tasks_report.pdf"
+            "Content-Disposition": "attachment; filename=tasks_report.ndjson",
+            "ETag": etag,
+            "Cache-Control": "private, no-cache"
         }
     )
+
+
+# =========================
+# Background Export Jobs
+# =========================
+@router.post("/jobs")
+def submit_export_job(
+    format: str = Form(...),
+    status: str | None = Form(None),
+    priority: str | None = Form(None),
+    type_id: str | None = Form(None),
+    assigned_to_id: str | None = Form(None),
+    from_date: str | None = Form(None),
+    to_date: str | None = Form(None),
+    columns: list[str] = Form([]),
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Unknown export format")
+
+    filters = _report_filters(status, priority, type_id, assigned_to_id, from_date, to_date)
+    try:
+        job = submit_export(user.id, format, filters, columns or None)
+    except ExportLimitReached as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+    return job_status(job)
+
+
+@router.get("/jobs/{job_id}")
+def export_job_status(
+    job_id: str,
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    job = get_export_job(job_id, user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export not found")
+
+    return job_status(job)
+
+
+@router.get("/jobs/{job_id}/download")
+def download_export_job(
+    job_id: str,
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    job = get_export_job(job_id, user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export not found")
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Export is {job.status}")
+
+    return FileResponse(job.path, media_type=job.media_type, filename=job.filename)
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import RedirectResponse
+from sqlalchemy.orm import Session
+
+from app.dependencies import get_db, get_current_user
+from app.ui import templates
+from app.models.user import User
+from app.services.search_service import search
+
+router = APIRouter(prefix="/ui/search")
+
+
+@router.get("")
+def search_page(
+    request: Request,
+    q: str | None = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    if not user:
+        return RedirectResponse("/login", status_code=303)
+
+    results = search(db, user, q or "") if q else []
+
+    return templates.TemplateResponse(
+        "search/results.html",
+        {
+            "request": request,
+            "user": user,
+            "q": q or "",
+            "results": results
+        }
+    )
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Request, Depends, Form
+from fastapi import APIRouter, Request, Depends, Form, HTTPException
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from datetime import date
 
+from app.config import settings
 from app.dependencies import get_current_user, get_db
 from app.ui import templates
 
@@ -10,6 +11,7 @@ from app.models.user import User
 from app.models.task import Task
 from app.models.milestone import TaskMilestone
 from app.models.task_type import TaskType
+from app.schemas.task import BulkTaskOperation
 
 from app.services.task_service import (
     create_task,
@@ -17,18 +19,27 @@ from app.services.task_service import (
     submit_for_review,
     approve_task,
     return_task,
-    complete_task
+    complete_task,
+    bulk_update_tasks
 )
 from app.services.milestone_service import add_milestone, update_milestone_status
+from app.services.dashboard_cache import invalidate_task
 
-from app.utils.hierarchy import get_all_subordinate_ids, can_assign_task
+from app.utils.hierarchy import get_all_subordinate_ids, can_assign_task, get_auth_context
 from app.utils.workflow import (
     can_submit_for_review,
     can_review_task,
     can_complete_task
 )
-from app.utils.permissions import can_edit_task
+from app.utils.permissions import can_edit_task, require_login
 from app.utils.task_visibility import apply_task_visibility
+from app.utils.loaders import task_list_options
+from app.utils.pagination import (
+    cached_count,
+    clamp_page_size,
+    decode_cursor,
+    keyset_page
+)
 
 router = APIRouter(prefix="/ui/tasks")
 
@@ -55,6 +66,9 @@ def task_list(
     assigned_to_id: int | None = None,
     from_date: str | None = None,
     to_date: str | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    per_page: int | None = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
@@ -99,7 +113,29 @@ def task_list(
     if to_dt:
         q = q.filter(Task.final_deadline <= to_dt)
 
-    tasks = q.order_by(Task.final_deadline.asc()).all()
+    # ================= PAGINATION (KEYSET) =================
+    page_size = clamp_page_size(per_page, settings.task_page_size)
+    tasks, next_cursor, prev_cursor = keyset_page(
+        q.options(*task_list_options()),
+        Task.final_deadline,
+        Task.id,
+        page_size,
+        after=decode_cursor(after),
+        before=decode_cursor(before)
+    )
+
+    total = cached_count(
+        (user.id, today, filter, status, priority, type_id, assigned_to_id, from_dt, to_dt),
+        q,
+        settings.task_count_cache_seconds
+    )
+
+    # Row actions come from one batch pass over the page
+    ctx = get_auth_context(user)
+
+    base_url = request.url.remove_query_params(["after", "before"])
+    next_url = f"?{base_url.include_query_params(after=next_cursor).query}" if next_cursor else None
+    prev_url = f"?{base_url.include_query_params(before=prev_cursor).query}" if prev_cursor else None
 
     return templates.TemplateResponse(
         "tasks/list.html",
@@ -107,7 +143,12 @@ def task_list(
             "request": request,
             "tasks": tasks,
             "user": user,
+            "editable_ids": ctx.editable_task_ids(tasks),
+            "reviewable_ids": ctx.reviewable_task_ids(tasks),
             "active_filter": filter,
+            "total": total,
+            "next_url": next_url,
+            "prev_url": prev_url,
             "filters": {
                 "status": status,
                 "priority": priority,
@@ -212,13 +253,14 @@ def create_task_submit(
     )
 
     # ---- Create milestones (Step 8.5) ----
+    milestones = []
     for idx, (m_title, m_deadline_raw) in enumerate(
         zip(milestone_title, milestone_deadline),
         start=1
     ):
         m_deadline = _parse_date(m_deadline_raw)
         if m_title and m_deadline:
-            db.add(
+            milestones.append(
                 TaskMilestone(
                     task_id=task.id,
                     title=m_title,
@@ -227,7 +269,16 @@ def create_task_submit(
                 )
             )
 
+    # All new milestones are Pending, so the counters follow directly
+    if milestones:
+        db.add_all(milestones)
+        task.milestone_total = len(milestones)
+        task.milestone_completed = 0
+        task.next_milestone_deadline = min(m.deadline for m in milestones)
+        task.max_sequence = milestones[-1].sequence
+
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
 
     return RedirectResponse("/ui/tasks", status_code=303)
 
@@ -249,6 +300,7 @@ def task_detail(
     if not task:
         return RedirectResponse("/ui/tasks", status_code=303)
     can_edit = can_edit_task(user, task)
+    can_review = can_review_task(user, task)
 
     milestones = (
         db.query(TaskMilestone)
@@ -264,7 +316,8 @@ def task_detail(
             "task": task,
             "milestones": milestones,
             "user": user,
-            "can_edit": can_edit
+            "can_edit": can_edit,
+            "can_review": can_review
         }
     )
 
@@ -322,6 +375,33 @@ def complete_task_submit(
     return RedirectResponse(f"/ui/tasks/{task_id}", status_code=303)
 
 
+# =========================
+# Bulk Operations
+# =========================
+@router.post("/bulk")
+def bulk_task_operation(
+    payload: BulkTaskOperation,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    """
+    Reassign, re-prioritize, archive or move many tasks through the
+    workflow in one transaction; the response reports each task.
+    """
+    require_login(user)
+
+    if len(payload.task_ids) > settings.bulk_task_limit:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.bulk_task_limit} tasks per request"
+        )
+
+    try:
+        return bulk_update_tasks(db, user, payload.task_ids, payload.operation, payload.value)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 # =========================
 # Milestones (Post Creation)
 # =========================
@@ -6,6 +6,7 @@ from app.dependencies import get_current_user, get_db
 from app.ui import templates
 from app.models.task_type import TaskType
 from app.models.user import User
+from app.utils.ui_cache import bump_version
 
 router = APIRouter(prefix="/ui/task-types")
 
@@ -71,6 +72,7 @@ def create_task_type(
         is_active=True
     ))
     db.commit()
+    bump_version()
 
     return RedirectResponse("/ui/task-types", status_code=303)
 
@@ -91,5 +93,6 @@ def toggle_task_type(
     if task_type and task_type.department == user.department:
         task_type.is_active = not task_type.is_active
         db.commit()
+        bump_version()
 
     return RedirectResponse("/ui/task-types", status_code=303)
@@ -7,6 +7,11 @@ from app.ui import templates
 from app.models.user import User
 from app.models.privilege import Privilege
 from app.utils.security import hash_password
+from app.utils.ui_cache import bump_version
+from app.utils.principal_cache import bump_security_version
+from app.utils.privileges import privilege_codes, user_privilege_masks
+from app.services.hierarchy_service import set_manager
+from app.services.dashboard_cache import clear_dashboard_cache
 
 router = APIRouter(prefix="/ui/users")
 
@@ -22,10 +27,19 @@ def user_list(
 
     users = db.query(User).order_by(User.username).all()
     managers = users
+    # One query for every user's privileges instead of a lazy load per row
+    masks = user_privilege_masks(db)
+    user_privilege_codes = {u.id: privilege_codes(masks.get(u.id, 0)) for u in users}
 
     return templates.TemplateResponse(
         "users/list.html",
-        {"request": request, "users": users, "managers": managers, "user": user}
+        {
+            "request": request,
+            "users": users,
+            "managers": managers,
+            "user_privilege_codes": user_privilege_codes,
+            "user": user
+        }
     )
 
 
@@ -78,8 +92,7 @@ def create_user_submit(
         username=username_val,
         password_hash=hash_password(password),
         role=role.strip(),
-        department=department.strip() or None,
-        manager_id=manager_id
+        department=department.strip() or None
     )
 
     if privilege_ids:
@@ -90,7 +103,10 @@ def create_user_submit(
         )
 
     db.add(new_user)
+    db.flush()
+    set_manager(db, new_user, manager_id)
     db.commit()
+    bump_version()
 
     return RedirectResponse("/ui/users", status_code=303)
 
@@ -163,10 +179,13 @@ def edit_user_submit(
     if duplicate:
         return RedirectResponse(f"/ui/users/{user_id}/edit", status_code=303)
 
+    new_manager_id = None if manager_id == user_id else manager_id
+    if new_manager_id != target.manager_id and not set_manager(db, target, new_manager_id):
+        return RedirectResponse(f"/ui/users/{user_id}/edit", status_code=303)
+
     target.username = username_val
     target.role = role.strip()
     target.department = (department or "").strip() or None
-    target.manager_id = None if manager_id == user_id else manager_id
     target.is_active = bool(is_active)
 
     password_val = (password or "").strip()
@@ -183,6 +202,9 @@ def edit_user_submit(
         target.privileges = []
 
     db.commit()
+    bump_version()
+    bump_security_version(target.id)
+    clear_dashboard_cache()
     return RedirectResponse("/ui/users", status_code=303)
 
 
@@ -203,7 +225,10 @@ def update_user_manager(
     if manager_id == user_id:
         return RedirectResponse("/ui/users", status_code=303)
 
-    target.manager_id = manager_id or None
+    if not set_manager(db, target, manager_id):
+        return RedirectResponse("/ui/users", status_code=303)
     db.commit()
+    bump_security_version(target.id)
+    clear_dashboard_cache()
 
     return RedirectResponse("/ui/users", status_code=303)
@@ -17,3 +17,9 @@ class TaskOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+class BulkTaskOperation(BaseModel):
+    task_ids: list[int]
+    operation: str
+    # assignee id for "reassign" (null unassigns), priority for "priority"
+    value: int | str | None = None
@@ -0,0 +1,210 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.report_service import task_filter_conditions
+from app.utils.task_visibility import task_visibility_clause
+
+
+GROUPINGS = ("assignee", "type", "department")
+PERCENTILES = (("median", 0.5), ("p90", 0.9))
+DEFAULT_WEEKS = 12
+
+
+# =========================
+# Dialect helpers
+# =========================
+def _days_between(db: Session, start, end):
+    if db.get_bind().dialect.name == "sqlite":
+        return func.julianday(end) - func.julianday(start)
+    return func.extract("epoch", end - start) / 86400.0
+
+
+def _week_start(db: Session, column):
+    # Monday of the ISO week, as a date
+    if db.get_bind().dialect.name == "sqlite":
+        return func.date(column, "-6 days", "weekday 1")
+    return func.date(func.date_trunc("week", column))
+
+
+def _group_columns(group_by: str) -> tuple:
+    """
+    (key, label, joins) for the chosen grouping; key is what rows are
+    grouped and ordered by, label is what the UI shows.
+    """
+    if group_by == "assignee":
+        return (
+            Task.assigned_to_id,
+            func.coalesce(User.username, "Unassigned"),
+            [(User, User.id == Task.assigned_to_id)]
+        )
+    if group_by == "type":
+        return (
+            Task.type_id,
+            TaskType.name,
+            [(TaskType, TaskType.id == Task.type_id)]
+        )
+    return (
+        TaskType.department,
+        TaskType.department,
+        [(TaskType, TaskType.id == Task.type_id)]
+    )
+
+
+def _joined(stmt, joins):
+    for target, onclause in joins:
+        stmt = stmt.outerjoin(target, onclause)
+    return stmt
+
+
+# =========================
+# Percentiles
+# =========================
+def _grouped_quantiles(keys: list, values: list, quantiles) -> dict:
+    """
+    Linear-interpolated quantiles of `values` per group (numpy's default
+    method). Rows must already be ordered by (key, value) - the database
+    does that sort - so every group's quantile is one vectorized index
+    lookup into its run.
+    """
+    if not keys:
+        return {}
+
+    keys_arr = np.array(keys, dtype=object)
+    values_arr = np.asarray(values, dtype=float)
+    starts = np.flatnonzero(
+        np.concatenate(([True], keys_arr[1:] != keys_arr[:-1]))
+    )
+    counts = np.diff(np.append(starts, len(values_arr)))
+
+    result = {keys_arr[s]: {} for s in starts}
+    for name, q in quantiles:
+        pos = starts + q * (counts - 1)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo + 1, starts + counts - 1)
+        interpolated = values_arr[lo] + (values_arr[hi] - values_arr[lo]) * (pos - lo)
+        for s, value in zip(starts, interpolated):
+            result[keys_arr[s]][name] = float(value)
+    return result
+
+
+def _cycle_time_percentiles(db: Session, key, joins, conditions, start_col, end_col) -> dict:
+    days = _days_between(db, start_col, end_col).label("days")
+    stmt = _joined(select(key.label("key"), days).select_from(Task), joins).where(
+        *conditions,
+        end_col.is_not(None)
+    ).order_by(key, days)
+
+    keys = []
+    values = []
+    for row in db.execute(stmt):
+        keys.append(row.key)
+        values.append(row.days)
+    return _grouped_quantiles(keys, values, PERCENTILES)
+
+
+def _rounded(stats: dict | None) -> dict:
+    return {
+        name: round(stats[name], 2) if stats and name in stats else None
+        for name, _ in PERCENTILES
+    }
+
+
+# =========================
+# Analytics
+# =========================
+def task_analytics(
+    db: Session,
+    user,
+    filters: dict,
+    group_by: str = "assignee",
+    weeks: int = DEFAULT_WEEKS,
+    today: date | None = None
+) -> dict:
+    """
+    Task counts and cycle times (created -> submitted, created -> completed,
+    in days) per assignee, task type or department, plus completions per
+    week for the last `weeks` weeks, over the tasks `user` may see (the
+    task list's visibility rules). Counting and grouping happen in the
+    database; only the per-group percentiles are computed here.
+    """
+    if group_by not in GROUPINGS:
+        raise ValueError(f"Unknown grouping: {group_by}")
+
+    today = today or date.today()
+    key, label, joins = _group_columns(group_by)
+    conditions = task_filter_conditions(filters)
+    visibility = task_visibility_clause(user)
+    if visibility is not None:
+        conditions.append(visibility)
+
+    # -------- COUNTS --------
+    counts_stmt = _joined(
+        select(
+            key.label("key"),
+            label.label("label"),
+            func.count(Task.id).label("total"),
+            func.count(Task.submitted_at).label("submitted"),
+            func.count(Task.completed_at).label("completed"),
+            func.sum(case(
+                (and_(Task.completed_at.is_(None), Task.final_deadline < today), 1),
+                else_=0
+            )).label("overdue"),
+        ).select_from(Task),
+        joins
+    ).where(*conditions).group_by(key, label).order_by(func.count(Task.id).desc(), label)
+
+    submit_times = _cycle_time_percentiles(
+        db, key, joins, conditions, Task.created_at, Task.submitted_at
+    )
+    complete_times = _cycle_time_percentiles(
+        db, key, joins, conditions, Task.created_at, Task.completed_at
+    )
+
+    groups = []
+    for row in db.execute(counts_stmt):
+        groups.append({
+            "key": row.key,
+            "label": row.label if row.label is not None else "Unassigned",
+            "total": row.total,
+            "submitted": row.submitted,
+            "completed": row.completed,
+            "overdue": row.overdue or 0,
+            "days_to_submit": _rounded(submit_times.get(row.key)),
+            "days_to_complete": _rounded(complete_times.get(row.key)),
+        })
+
+    # -------- WEEKLY COMPLETIONS --------
+    first_week = today - timedelta(days=today.weekday(), weeks=max(weeks, 1) - 1)
+    week = _week_start(db, Task.completed_at).label("week")
+    weekly_stmt = (
+        select(week, func.count(Task.id).label("completed"))
+        .where(
+            *conditions,
+            Task.completed_at >= datetime.combine(first_week, datetime.min.time())
+        )
+        .group_by(week)
+    )
+    per_week = {
+        str(row.week): row.completed
+        for row in db.execute(weekly_stmt)
+    }
+
+    weekly = []
+    for offset in range(max(weeks, 1)):
+        week_start = first_week + timedelta(weeks=offset)
+        weekly.append({
+            "week": week_start.isoformat(),
+            "completed": per_week.get(week_start.isoformat(), 0),
+        })
+
+    return {
+        "group_by": group_by,
+        "groups": groups,
+        "weekly_completed": weekly,
+    }
@@ -1,11 +1,29 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.models.user import User
-from app.utils.security import verify_password
+from app.utils.security import verify_and_update_bounded
 
-def authenticate_user(db: Session, username: str, password: str) -> User | None:
-    user = db.query(User).filter(User.username == username, User.is_active == True).first()
+def _active_user(db: Session, username: str) -> User | None:
+    return db.query(User).filter(User.username == username, User.is_active == True).first()
+
+def _store_rehash(db: Session, user: User, new_hash: str):
+    user.password_hash = new_hash
+    db.commit()
+
+async def authenticate_user(db: Session, username: str, password: str) -> User | None:
+    """
+    Database work runs on the request threadpool and the argon2 check on
+    the bounded hashing pool, so the event loop is never blocked.
+    Raises PasswordHashBusy when the hashing pool cannot take the request.
+    """
+    user = await run_in_threadpool(_active_user, db, username)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+
+    valid, new_hash = await verify_and_update_bounded(password, user.password_hash)
+    if not valid:
         return None
+
+    if new_hash:
+        await run_in_threadpool(_store_rehash, db, user, new_hash)
     return user
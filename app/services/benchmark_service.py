@@ -0,0 +1,124 @@
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from app.services.report_service import EXPORT_COLUMNS, render_tasks_pdf
+from app.utils.security import hash_password, verify_and_update
+
+
+def _measure(fn) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = fn()
+    finally:
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"seconds": round(elapsed, 2), "peak_mb": round(peak / 1024 / 1024, 1), "result": result}
+
+
+# =========================
+# PDF rendering
+# =========================
+def _synthetic_report_rows(count: int):
+    """
+    Rows shaped like iter_export_rows output: every fifth task has two
+    milestones and every seventh title is long enough to wrap.
+    """
+    start = date(2026, 1, 1)
+    produced = 0
+    task_id = 0
+    while produced < count:
+        task_id += 1
+        title = f"Task {task_id}"
+        if task_id % 7 == 0:
+            title += " - prepare the consolidated quarterly compliance summary"
+        with_milestones = task_id % 5 == 0
+        blank = "" if with_milestones else "-"
+        yield [
+            task_id, title, "To Do", "Normal", "staff",
+            start + timedelta(days=task_id % 365), "-", blank, blank, blank
+        ]
+        produced += 1
+
+        if with_milestones:
+            for seq in (1, 2):
+                if produced >= count:
+                    return
+                yield [
+                    "", "", "", "", "", "", "",
+                    f"Milestone {seq} of task {task_id}", "Pending",
+                    start + timedelta(days=seq)
+                ]
+                produced += 1
+
+
+def benchmark_pdf(sizes=(1_000, 10_000, 50_000), single_table_limit: int = 10_000) -> list[dict]:
+    """
+    Render synthetic reports one page-sized LongTable at a time and, up to
+    `single_table_limit` rows, with one table for comparison.
+    """
+    results = []
+    for size in sizes:
+        modes = [("paged", False)]
+        if size <= single_table_limit:
+            modes.append(("single table", True))
+
+        for label, single_table in modes:
+            measured = _measure(
+                lambda: len(
+                    render_tasks_pdf(
+                        _synthetic_report_rows(size),
+                        EXPORT_COLUMNS,
+                        single_table=single_table
+                    ).getbuffer()
+                )
+            )
+            results.append({
+                "rows": size,
+                "mode": label,
+                "seconds": measured["seconds"],
+                "peak_mb": measured["peak_mb"],
+                "pdf_kb": measured["result"] // 1024,
+            })
+    return results
+
+
+# =========================
+# Password hashing
+# =========================
+def benchmark_login(workers=(1, 2, 4), logins: int = 40) -> list[dict]:
+    """
+    Time `logins` argon2 verifications with the configured cost parameters
+    on thread pools of each size, reporting throughput overall and per
+    core actually available to the pool.
+    """
+    password = "benchmark-password"
+    password_hash = hash_password(password)
+    cores = os.cpu_count() or 1
+
+    results = []
+    for size in workers:
+        with ThreadPoolExecutor(max_workers=size) as pool:
+            started = time.perf_counter()
+            verified = sum(
+                1 for ok, _ in pool.map(
+                    lambda _: verify_and_update(password, password_hash),
+                    range(logins)
+                ) if ok
+            )
+            elapsed = time.perf_counter() - started
+
+        per_second = verified / elapsed
+        results.append({
+            "workers": size,
+            "logins": verified,
+            "seconds": round(elapsed, 2),
+            "ms_per_login": round(elapsed / verified * 1000 * size, 1),
+            "per_second": round(per_second, 1),
+            "per_second_per_core": round(per_second / min(size, cores), 1),
+        })
+    return results
@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.user_hierarchy import UserHierarchy
+from app.services.dashboard_service import build_dashboard
+from app.services.kpi_service import build_kpis
+
+
+# Safety net for multi-worker deployments, mirroring app/utils/ui_cache.py
+MAX_AGE_SECONDS = 60
+
+_lock = threading.Lock()
+_entries: dict[int, tuple] = {}
+_user_generations: dict[int, int] = defaultdict(int)
+_global_generation = 0
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def _generation(user) -> tuple[int, int]:
+    # Admins see every task, so their entries also depend on the global counter
+    global_part = _global_generation if user.role == "admin" else 0
+    return (global_part, _user_generations[user.id])
+
+
+def _snapshot_task(task):
+    return SimpleNamespace(
+        id=task.id,
+        title=task.title,
+        status=task.status,
+        final_deadline=task.final_deadline
+    )
+
+
+def _snapshot_milestone(m):
+    return SimpleNamespace(
+        id=m.id,
+        task_id=m.task_id,
+        title=m.title,
+        status=m.status,
+        deadline=m.deadline
+    )
+
+
+def _snapshot_dashboard(data: dict) -> dict:
+    snapshot = {}
+    for section in ("today", "upcoming", "overdue"):
+        snapshot[section] = {
+            "tasks": [_snapshot_task(t) for t in data[section]["tasks"]],
+            "milestones": [
+                _snapshot_milestone(m) for m in data[section]["milestones"]
+            ],
+        }
+    snapshot["pending_review"] = [
+        _snapshot_task(t) for t in data["pending_review"]
+    ]
+    return snapshot
+
+
+# Each part of a user's entry is built on its own, so the KPI endpoint
+# never pays for the full dashboard
+_BUILDERS = {
+    "dashboard": lambda db, user: _snapshot_dashboard(build_dashboard(db, user)),
+    "kpis": build_kpis,
+}
+
+
+def _is_fresh(entry, today: date, generation, now: float) -> bool:
+    return (
+        entry is not None
+        and entry[0] == today
+        and entry[1] == generation
+        and now - entry[2] < MAX_AGE_SECONDS
+    )
+
+
+def _cached_parts(db: Session, user, parts: tuple[str, ...]) -> dict:
+    today = date.today()
+    now = time.monotonic()
+
+    with _lock:
+        generation = _generation(user)
+        entry = _entries.get(user.id)
+        if not _is_fresh(entry, today, generation, now):
+            entry = None
+        result = {
+            part: entry[3][part]
+            for part in parts
+            if entry is not None and part in entry[3]
+        }
+        missing = [part for part in parts if part not in result]
+        _stats["misses" if missing else "hits"] += 1
+
+    if not missing:
+        return result
+
+    built = {part: _BUILDERS[part](db, user) for part in missing}
+    result.update(built)
+
+    with _lock:
+        # Skip the store if an invalidation raced with the rebuild
+        if _generation(user) == generation:
+            current = _entries.get(user.id)
+            if _is_fresh(current, today, generation, time.monotonic()):
+                current[3].update(built)
+            else:
+                _entries[user.id] = (today, generation, time.monotonic(), dict(built))
+
+    return result
+
+
+def get_dashboard_snapshot(db: Session, user) -> dict:
+    """
+    Return {"dashboard": ..., "kpis": ...} for `user`, cached per user and
+    calendar date until a write touching their tasks invalidates it.
+    """
+    return _cached_parts(db, user, ("dashboard", "kpis"))
+
+
+def get_kpis_snapshot(db: Session, user) -> dict:
+    """
+    The KPI part of the dashboard snapshot on its own; a miss runs only
+    build_kpis, never build_dashboard.
+    """
+    return _cached_parts(db, user, ("kpis",))["kpis"]
+
+
+def invalidate_users(user_ids):
+    with _lock:
+        for user_id in user_ids:
+            _user_generations[user_id] += 1
+            _entries.pop(user_id, None)
+        _stats["invalidations"] += 1
+
+
+def invalidate_task(db: Session, *assignee_ids: int | None):
+    """
+    Drop the cached dashboards affected by a change to a task assigned to
+    any of `assignee_ids`: the assignees, every manager above them and
+    all admins.
+    """
+    global _global_generation
+
+    ids = {i for i in assignee_ids if i is not None}
+    if ids:
+        ids.update(
+            db.execute(
+                select(UserHierarchy.ancestor_id).where(
+                    UserHierarchy.descendant_id.in_(ids)
+                )
+            ).scalars()
+        )
+
+    with _lock:
+        _global_generation += 1
+    invalidate_users(ids)
+
+
+def clear_dashboard_cache():
+    """
+    Drop every entry, e.g. after the org hierarchy changes.
+    """
+    global _global_generation
+
+    with _lock:
+        _global_generation += 1
+        for user_id in list(_entries):
+            _user_generations[user_id] += 1
+        _entries.clear()
+        _stats["invalidations"] += 1
+
+
+def cache_stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries": len(_entries),
+            "hit_ratio": round(_stats["hits"] / lookups, 3) if lookups else None,
+        }
@@ -1,8 +1,10 @@
 from datetime import date, timedelta
+from sqlalchemy import case, or_
 from sqlalchemy.orm import Session
 from app.models.task import Task
 from app.models.milestone import TaskMilestone
 from app.utils.task_visibility import apply_task_visibility
+from app.utils.loaders import dashboard_task_options, dashboard_milestone_options
 
 
 def build_dashboard(db: Session, user):
@@ -10,61 +12,88 @@ def build_dashboard(db: Session, user):
     upcoming_limit = today + timedelta(days=7)
 
     # Base task query
-    task_q = db.query(Task).filter(Task.archived == False)
+    task_q = (
+        db.query(Task)
+        .options(*dashboard_task_options())
+        .filter(Task.archived == False)
+    )
     task_q = apply_task_visibility(task_q, user)
 
     # ---------- TASK GROUPS ----------
-    today_tasks = task_q.filter(
-        Task.final_deadline == today,
-        Task.status != "Completed"
-    ).all()
-    upcoming_tasks = task_q.filter(
-        Task.final_deadline > today,
-        Task.final_deadline <= upcoming_limit,
-        Task.status != "Completed"
-    ).all()
-    overdue_tasks = task_q.filter(
-        Task.final_deadline < today,
-        Task.status != "Completed"
-    ).all()
-    pending_review_tasks = task_q.filter(
-        Task.status == "Submitted for Review"
-    ).all()
-    completed_tasks = task_q.filter(
-        Task.status == "Completed"
-    ).all()
+    # One pass: only open tasks due within the window (or awaiting review)
+    # are materialized, tagged with the deadline bucket they fall in.
+    task_bucket = case(
+        (Task.final_deadline < today, "overdue"),
+        (Task.final_deadline == today, "today"),
+        (Task.final_deadline <= upcoming_limit, "upcoming"),
+        else_=None
+    ).label("bucket")
+
+    task_rows = (
+        task_q.add_columns(task_bucket)
+        .filter(
+            Task.status != "Completed",
+            or_(
+                Task.final_deadline <= upcoming_limit,
+                Task.status == "Submitted for Review"
+            )
+        )
+        .order_by(Task.final_deadline.asc(), Task.id.asc())
+        .all()
+    )
+
+    tasks_by_bucket = {"today": [], "upcoming": [], "overdue": []}
+    pending_review_tasks = []
+    for task, bucket in task_rows:
+        if bucket:
+            tasks_by_bucket[bucket].append(task)
+        if task.status == "Submitted for Review":
+            pending_review_tasks.append(task)
 
     # ---------- MILESTONE GROUPS ----------
     ms_q = (
         db.query(TaskMilestone)
+        .options(*dashboard_milestone_options())
         .join(TaskMilestone.task)
         .filter(Task.archived == False)
     )
     ms_q = apply_task_visibility(ms_q, user)
 
-    today_milestones = ms_q.filter(TaskMilestone.deadline == today).all()
-    upcoming_milestones = ms_q.filter(
-        TaskMilestone.deadline > today,
-        TaskMilestone.deadline <= upcoming_limit
-    ).all()
-    overdue_milestones = ms_q.filter(
-        TaskMilestone.deadline < today,
-        TaskMilestone.status != "Completed"
-    ).all()
+    ms_bucket = case(
+        (TaskMilestone.deadline < today, "overdue"),
+        (TaskMilestone.deadline == today, "today"),
+        else_="upcoming"
+    ).label("bucket")
+
+    ms_rows = (
+        ms_q.add_columns(ms_bucket)
+        .filter(
+            TaskMilestone.deadline <= upcoming_limit,
+            or_(
+                TaskMilestone.deadline >= today,
+                TaskMilestone.status != "Completed"
+            )
+        )
+        .order_by(TaskMilestone.deadline.asc(), TaskMilestone.id.asc())
+        .all()
+    )
+
+    milestones_by_bucket = {"today": [], "upcoming": [], "overdue": []}
+    for milestone, bucket in ms_rows:
+        milestones_by_bucket[bucket].append(milestone)
 
     return {
         "today": {
-            "tasks": today_tasks,
-            "milestones": today_milestones,
+            "tasks": tasks_by_bucket["today"],
+            "milestones": milestones_by_bucket["today"],
         },
         "upcoming": {
-            "tasks": upcoming_tasks,
-            "milestones": upcoming_milestones,
+            "tasks": tasks_by_bucket["upcoming"],
+            "milestones": milestones_by_bucket["upcoming"],
         },
         "overdue": {
-            "tasks": overdue_tasks,
-            "milestones": overdue_milestones,
+            "tasks": tasks_by_bucket["overdue"],
+            "milestones": milestones_by_bucket["overdue"],
         },
         "pending_review": pending_review_tasks,
-        "completed": completed_tasks,
     }
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import date
+
+from sqlalchemy import event, inspect, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.app_setting import AppSetting
+from app.models.milestone import TaskMilestone
+from app.models.quick_task import QuickTask
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.report_service import EXPORT_COLUMNS, report_filters
+
+
+DATA_VERSION_KEY = "report_data_version"
+WATCHED_CLASSES = (Task, TaskMilestone, QuickTask)
+# Exports also show assignee usernames and task type names. Only changes
+# to those columns (or deletions) invalidate them, so unrelated user
+# writes such as password rehashes on login leave the cache alone and
+# do not contend on the version row.
+WATCHED_COLUMNS = {
+    User: ("username",),
+    TaskType: ("name",),
+}
+WATCHED_TABLES = {
+    cls.__tablename__ for cls in (*WATCHED_CLASSES, *WATCHED_COLUMNS)
+}
+
+
+# =========================
+# Data version stamp
+# =========================
+# Stored in app_settings and replaced in the same transaction as any ORM
+# write to a watched table, so every worker process sees a new stamp as
+# soon as the write commits.
+def get_data_version(db: Session) -> str:
+    value = (
+        db.query(AppSetting.value)
+        .filter(AppSetting.key == DATA_VERSION_KEY)
+        .scalar()
+    )
+    return value or "0"
+
+
+def _bump_data_version(session: Session):
+    # Once per transaction is enough
+    if session.info.get("data_version_bumped"):
+        return
+    session.connection().execute(
+        update(AppSetting.__table__)
+        .where(AppSetting.key == DATA_VERSION_KEY)
+        .values(value=uuid.uuid4().hex)
+    )
+    session.info["data_version_bumped"] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _reset_bump_flag(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("data_version_bumped", None)
+
+
+def _changes_exported_columns(obj) -> bool:
+    columns = WATCHED_COLUMNS.get(type(obj))
+    if not columns:
+        return False
+    attrs = inspect(obj).attrs
+    return any(attrs[name].history.has_changes() for name in columns)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_on_flush(session, flush_context):
+    # New users and task types have no tasks yet, so they change no export
+    changed = (
+        any(isinstance(obj, WATCHED_CLASSES) for obj in (*session.new, *session.dirty))
+        or any(_changes_exported_columns(obj) for obj in session.dirty)
+        or any(
+            isinstance(obj, (*WATCHED_CLASSES, *WATCHED_COLUMNS))
+            for obj in session.deleted
+        )
+    )
+    if changed:
+        _bump_data_version(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_bulk_write(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements bypass the flush; their
+    # columns are not inspected, so any bulk write to a watched table
+    # (users and task types included) bumps
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in WATCHED_TABLES:
+        _bump_data_version(state.session)
+
+
+# =========================
+# Keys and ETags
+# =========================
+def export_cache_key(
+    db: Session,
+    fmt: str,
+    filters: dict,
+    columns: list[str] | None
+) -> str:
+    """
+    Hash of the normalized export request plus the current data version.
+
+    The caller's identity is deliberately not part of the key: report
+    exports are unscoped, so every user gets the same file for the same
+    request. If exports ever apply task visibility, the user's scope
+    (id, role and subordinate set) must be added to the payload, or one
+    user's cached export will be served to another.
+    """
+    payload = {
+        "format": fmt,
+        "filters": {
+            key: value.isoformat() if isinstance(value, date) else value
+            for key, value in report_filters(**filters).items()
+        },
+        "columns": list(columns) if columns else EXPORT_COLUMNS,
+        "version": get_data_version(db),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def etag_for(key: str) -> str:
+    return f'"{key}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    return "*" in candidates or etag in [c.removeprefix("W/") for c in candidates]
+
+
+# =========================
+# On-disk store
+# =========================
+def _cache_path(key: str, extension: str) -> str:
+    return os.path.join(settings.export_cache_dir, f"{key}.{extension}")
+
+
+def get_or_build_export(key: str, extension: str, build) -> str:
+    """
+    Return the path of the cached artifact for `key`, calling `build()`
+    (which returns a readable file object) only on a miss.
+    """
+    path = _cache_path(key, extension)
+    if os.path.exists(path):
+        os.utime(path)
+        return path
+
+    os.makedirs(settings.export_cache_dir, exist_ok=True)
+    output = build()
+
+    partial = f"{path}.{uuid.uuid4().hex}.part"
+    with output, open(partial, "wb") as f:
+        shutil.copyfileobj(output, f)
+    os.replace(partial, path)
+
+    purge_export_cache()
+    return path
+
+
+def purge_export_cache() -> int:
+    """
+    Delete cached artifacts not used within settings.export_cache_ttl_seconds.
+    Entries for older data versions are never requested again, so they
+    age out here.
+    """
+    cutoff = time.time() - settings.export_cache_ttl_seconds
+
+    removed = 0
+    try:
+        entries = list(os.scandir(settings.export_cache_dir))
+    except FileNotFoundError:
+        return 0
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
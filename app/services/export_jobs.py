@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+from app.config import settings
+
+
+# Job records are process-local, like the other caches in this app; the
+# artifacts themselves live in settings.export_dir.
+EXPORT_FORMATS = {
+    "excel": {
+        "extension": "xlsx",
+        "media_type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    },
+    "pdf": {
+        "extension": "pdf",
+        "media_type": "application/pdf",
+    },
+}
+ACTIVE_STATUSES = ("queued", "running")
+
+_lock = threading.Lock()
+_jobs: dict[str, SimpleNamespace] = {}
+_executor = None
+
+
+class ExportLimitReached(Exception):
+    pass
+
+
+# =========================
+# Worker process
+# =========================
+def _init_worker():
+    # Register every mapped class so relationship() strings resolve
+    import app.models.app_setting  # noqa: F401
+    import app.models.milestone  # noqa: F401
+    import app.models.privilege  # noqa: F401
+    import app.models.quick_task  # noqa: F401
+    import app.models.task  # noqa: F401
+    import app.models.task_type  # noqa: F401
+    import app.models.user  # noqa: F401
+    import app.models.user_hierarchy  # noqa: F401
+    import app.models.user_privilege  # noqa: F401
+
+
+def _build_artifact(
+    fmt: str,
+    filters: dict,
+    columns: list[str] | None,
+    path: str
+) -> int:
+    from app.database import SessionLocal
+    from app.services.report_service import generate_tasks_excel, generate_tasks_pdf
+
+    generate = generate_tasks_excel if fmt == "excel" else generate_tasks_pdf
+
+    db = SessionLocal()
+    try:
+        output = generate(db, filters, columns)
+    finally:
+        db.close()
+
+    partial = f"{path}.part"
+    with output, open(partial, "wb") as f:
+        shutil.copyfileobj(output, f)
+    os.replace(partial, path)
+    return os.path.getsize(path)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: never fork the server's threads, locks or pooled connections
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.export_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+    return _executor
+
+
+def shutdown_export_workers():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# =========================
+# Job lifecycle
+# =========================
+def _artifact_path(job_id: str, fmt: str) -> str:
+    return os.path.join(
+        settings.export_dir,
+        f"{job_id}.{EXPORT_FORMATS[fmt]['extension']}"
+    )
+
+
+def _on_done(job: SimpleNamespace, future):
+    with _lock:
+        job.finished_at = time.time()
+        # e.g. pending work dropped by shutdown_export_workers();
+        # exception() would raise CancelledError here
+        if future.cancelled():
+            job.status = "cancelled"
+            job.error = "Export was cancelled"
+            return
+        error = future.exception()
+        if error is None:
+            job.status = "done"
+            job.size = future.result()
+        else:
+            job.status = "failed"
+            job.error = str(error) or type(error).__name__
+
+
+def _mark_running(job: SimpleNamespace):
+    with _lock:
+        if job.status == "queued":
+            job.status = "running"
+
+
+def submit_export(
+    user_id: int,
+    fmt: str,
+    filters: dict,
+    columns: list[str] | None
+) -> SimpleNamespace:
+    """
+    Queue an XLSX/PDF export on the worker pool and return its job.
+    Raises ExportLimitReached when the user already has
+    settings.export_jobs_per_user exports queued or running.
+    """
+    cleanup_expired_exports()
+    os.makedirs(settings.export_dir, exist_ok=True)
+
+    job_id = uuid.uuid4().hex
+    job = SimpleNamespace(
+        id=job_id,
+        user_id=user_id,
+        format=fmt,
+        status="queued",
+        created_at=time.time(),
+        finished_at=None,
+        size=None,
+        error=None,
+        path=_artifact_path(job_id, fmt),
+        filename=f"tasks_report.{EXPORT_FORMATS[fmt]['extension']}",
+        media_type=EXPORT_FORMATS[fmt]["media_type"],
+        future=None
+    )
+
+    with _lock:
+        active = sum(
+            1 for j in _jobs.values()
+            if j.user_id == user_id and j.status in ACTIVE_STATUSES
+        )
+        if active >= settings.export_jobs_per_user:
+            raise ExportLimitReached(
+                f"At most {settings.export_jobs_per_user} exports can run at once"
+            )
+        _jobs[job_id] = job
+
+    future = _get_executor().submit(
+        _build_artifact, fmt, filters, columns, job.path
+    )
+    future.add_done_callback(lambda f: _on_done(job, f))
+    job.future = future
+    return job
+
+
+def get_export_job(job_id: str, user_id: int) -> SimpleNamespace | None:
+    with _lock:
+        job = _jobs.get(job_id)
+    if job is None or job.user_id != user_id:
+        return None
+    # The pool has no start callback, so "running" is noticed on poll
+    if job.status == "queued" and job.future is not None and job.future.running():
+        _mark_running(job)
+    return job
+
+
+def job_status(job: SimpleNamespace) -> dict:
+    return {
+        "id": job.id,
+        "format": job.format,
+        "status": job.status,
+        "size": job.size,
+        "error": job.error,
+        "status_url": f"/ui/reports/jobs/{job.id}",
+        "download_url": f"/ui/reports/jobs/{job.id}/download" if job.status == "done" else None,
+    }
+
+
+def cleanup_expired_exports() -> int:
+    """
+    Forget finished jobs older than settings.export_ttl_seconds and delete
+    any artifact in the export directory past that age, including ones
+    left behind by a previous run.
+    """
+    cutoff = time.time() - settings.export_ttl_seconds
+
+    with _lock:
+        expired = [
+            job_id for job_id, job in _jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del _jobs[job_id]
+        live_paths = {job.path for job in _jobs.values()}
+        live_paths |= {f"{path}.part" for path in live_paths}
+
+    removed = 0
+    try:
+        entries = list(os.scandir(settings.export_dir))
+    except FileNotFoundError:
+        return 0
+
+    for entry in entries:
+        if entry.path in live_paths or not entry.is_file():
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
@@ -0,0 +1,168 @@
+from sqlalchemy import select, insert, delete
+from sqlalchemy.orm import Session, aliased
+
+from app.models.user import User
+from app.models.user_hierarchy import UserHierarchy
+
+
+# =========================
+# Incremental Maintenance
+# =========================
+def set_manager(db: Session, user: User, manager_id: int | None) -> bool:
+    """
+    Move `user` (and its whole subtree) under `manager_id`, keeping the
+    user_hierarchy closure table in step with users.manager_id.
+
+    Returns False without changing anything when the move would create a
+    cycle. The caller owns the transaction and must commit.
+    """
+    manager_id = manager_id or None
+    # Flush first: a pending user has no id yet, and None == None would
+    # read as managing itself
+    if user.id is None:
+        db.flush()
+
+    if manager_id == user.id:
+        return False
+
+    _ensure_self_row(db, user.id)
+
+    if manager_id is not None:
+        in_subtree = db.execute(
+            select(UserHierarchy.depth).where(
+                UserHierarchy.ancestor_id == user.id,
+                UserHierarchy.descendant_id == manager_id
+            )
+        ).first()
+        if in_subtree:
+            return False
+        _ensure_self_row(db, manager_id)
+
+    subtree = select(UserHierarchy.descendant_id).where(
+        UserHierarchy.ancestor_id == user.id
+    )
+
+    # Detach the subtree from all of its current ancestors
+    db.execute(
+        delete(UserHierarchy).where(
+            UserHierarchy.descendant_id.in_(subtree),
+            UserHierarchy.ancestor_id.notin_(subtree)
+        )
+    )
+
+    # Re-attach under every ancestor of the new manager
+    if manager_id is not None:
+        supers = aliased(UserHierarchy)
+        subs = aliased(UserHierarchy)
+        db.execute(
+            insert(UserHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    supers.ancestor_id,
+                    subs.descendant_id,
+                    supers.depth + subs.depth + 1
+                )
+                .select_from(supers)
+                .join(subs, subs.ancestor_id == user.id)
+                .where(supers.descendant_id == manager_id)
+            )
+        )
+
+    user.manager_id = manager_id
+    return True
+
+
+def _ensure_self_row(db: Session, user_id: int):
+    exists = db.execute(
+        select(UserHierarchy.depth).where(
+            UserHierarchy.ancestor_id == user_id,
+            UserHierarchy.descendant_id == user_id
+        )
+    ).first()
+    if not exists:
+        db.execute(
+            insert(UserHierarchy).values(
+                ancestor_id=user_id,
+                descendant_id=user_id,
+                depth=0
+            )
+        )
+
+
+# =========================
+# Rebuild / Verify
+# =========================
+def compute_closure(db: Session) -> tuple[set[tuple[int, int, int]], list[int]]:
+    """
+    Derive the closure rows from users.manager_id.
+    Returns (rows, cyclic_user_ids); users caught in a manager cycle only
+    get their depth-0 row and are reported instead of looping forever.
+    """
+    managers = dict(db.execute(select(User.id, User.manager_id)).all())
+
+    rows = set()
+    cyclic = []
+    for user_id in managers:
+        rows.add((user_id, user_id, 0))
+        seen = {user_id}
+        depth = 0
+        current = managers.get(user_id)
+        while current is not None and current in managers:
+            if current in seen:
+                cyclic.append(user_id)
+                break
+            depth += 1
+            rows.add((current, user_id, depth))
+            seen.add(current)
+            current = managers.get(current)
+
+    if cyclic:
+        rows = {
+            row for row in rows
+            if row[2] == 0 or (row[0] not in cyclic and row[1] not in cyclic)
+        }
+
+    return rows, cyclic
+
+
+def rebuild_hierarchy(db: Session) -> dict:
+    """
+    Recreate the closure table from scratch and commit.
+    """
+    rows, cyclic = compute_closure(db)
+
+    db.execute(delete(UserHierarchy))
+    if rows:
+        db.execute(
+            insert(UserHierarchy),
+            [
+                {"ancestor_id": a, "descendant_id": d, "depth": depth}
+                for a, d, depth in rows
+            ]
+        )
+    db.commit()
+
+    return {"rows": len(rows), "cyclic_user_ids": sorted(cyclic)}
+
+
+def verify_hierarchy(db: Session) -> dict:
+    """
+    Compare the stored closure table with one derived from users.manager_id.
+    """
+    expected, cyclic = compute_closure(db)
+    stored = set(
+        db.execute(
+            select(
+                UserHierarchy.ancestor_id,
+                UserHierarchy.descendant_id,
+                UserHierarchy.depth
+            )
+        ).all()
+    )
+
+    return {
+        "ok": expected == stored and not cyclic,
+        "missing": sorted(expected - stored),
+        "unexpected": sorted(stored - expected),
+        "cyclic_user_ids": sorted(cyclic),
+    }
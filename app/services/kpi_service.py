@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+from app.models.task import Task
+from app.utils.task_visibility import apply_task_visibility
+
+
+def _flag(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def build_kpis(db: Session, user) -> dict:
+    """
+    Dashboard tile counts and chart breakdown from a single
+    GROUP BY status aggregate over the user's visible tasks.
+    """
+    today = date.today()
+    upcoming_limit = today + timedelta(days=7)
+
+    q = db.query(
+        Task.status,
+        func.count(Task.id),
+        _flag(Task.final_deadline < today),
+        _flag(Task.final_deadline <= upcoming_limit),
+        _flag(Task.assigned_to_id == user.id),
+    ).filter(Task.archived == False)
+    q = apply_task_visibility(q, user)
+
+    total_tasks = 0
+    my_tasks = 0
+    pending_review = 0
+    overdue = 0
+    completed = 0
+
+    for status, count, overdue_count, due_soon_count, mine_count in q.group_by(Task.status):
+        if status != "Submitted for Review":
+            my_tasks += mine_count or 0
+
+        if status == "Completed":
+            completed += count
+            continue
+
+        # Open tasks due today, this week or already overdue
+        total_tasks += due_soon_count or 0
+        overdue += overdue_count or 0
+
+        if status == "Submitted for Review":
+            pending_review += count
+
+    return {
+        "total_tasks": total_tasks,
+        "my_tasks": my_tasks,
+        "pending_review": pending_review,
+        "overdue": overdue,
+        "completed": completed,
+        "chart_data": {
+            "completed": completed,
+            "pending_review": pending_review,
+            "overdue": overdue,
+            "in_progress": max(
+                total_tasks - completed - pending_review - overdue, 0
+            )
+        },
+    }
@@ -1,8 +1,77 @@
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from datetime import datetime
 from app.models.milestone import TaskMilestone
 from app.models.task import Task
+from app.services.dashboard_cache import invalidate_task
 
+
+# =========================
+# Denormalized Counters
+# =========================
+def milestone_counter_values() -> dict:
+    """
+    Correlated subqueries recomputing the Task milestone counters from
+    task_milestones, for use in UPDATE tasks SET ... statements.
+    """
+    def per_task(expr, *where):
+        return (
+            select(expr)
+            .where(TaskMilestone.task_id == Task.id, *where)
+            .scalar_subquery()
+        )
+
+    return {
+        Task.milestone_total: per_task(func.count(TaskMilestone.id)),
+        Task.milestone_completed: per_task(
+            func.count(TaskMilestone.id),
+            TaskMilestone.status == "Completed"
+        ),
+        Task.next_milestone_deadline: per_task(
+            func.min(TaskMilestone.deadline),
+            TaskMilestone.status != "Completed"
+        ),
+        Task.max_sequence: func.coalesce(
+            per_task(func.max(TaskMilestone.sequence)), 0
+        ),
+    }
+
+
+def sync_milestone_counters(db: Session, task_ids: list[int] | None = None) -> int:
+    """
+    Recompute the counters in a single UPDATE, inside the caller's
+    transaction. All tasks are repaired when `task_ids` is None.
+    """
+    stmt = update(Task).values(milestone_counter_values())
+    if task_ids is not None:
+        stmt = stmt.where(Task.id.in_(task_ids))
+
+    result = db.execute(stmt.execution_options(synchronize_session="fetch"))
+    return result.rowcount
+
+
+def milestone_counter_drift(db: Session) -> list[int]:
+    """
+    Ids of tasks whose stored counters disagree with task_milestones.
+    """
+    expected = milestone_counter_values()
+    return list(
+        db.execute(
+            select(Task.id).where(
+                (Task.milestone_total != expected[Task.milestone_total])
+                | (Task.milestone_completed != expected[Task.milestone_completed])
+                | Task.next_milestone_deadline.is_distinct_from(
+                    expected[Task.next_milestone_deadline]
+                )
+                | (Task.max_sequence != expected[Task.max_sequence])
+            ).order_by(Task.id)
+        ).scalars()
+    )
+
+
+# =========================
+# Milestone Changes
+# =========================
 def add_milestone(
     db: Session,
     task: Task,
@@ -13,7 +82,7 @@ def add_milestone(
 ) -> TaskMilestone:
 
     if sequence is None:
-        sequence = len(task.milestones) + 1
+        sequence = task.max_sequence + 1
 
     milestone = TaskMilestone(
         task_id=task.id,
@@ -23,10 +92,13 @@ def add_milestone(
         sequence=sequence,
         status="Pending"
     )
-    
+
     db.add(milestone)
+    db.flush()
+    sync_milestone_counters(db, [task.id])
     db.commit()
     db.refresh(milestone)
+    invalidate_task(db, task.assigned_to_id)
     return milestone
 
 
@@ -36,28 +108,38 @@ def update_milestone_status(
     new_status: str
 ):
     milestone.status = new_status
-    db.commit()
+    db.flush()
+    sync_milestone_counters(db, [milestone.task_id])
 
-    _auto_complete_task_if_needed(db, milestone.task)
+    _auto_complete_task_if_needed(milestone.task)
+    db.commit()
+    invalidate_task(db, milestone.task.assigned_to_id)
 
 
-def _auto_complete_task_if_needed(db: Session, task: Task):
-    if not task.milestones:
+def _auto_complete_task_if_needed(task: Task):
+    if not task.milestone_total:
         return  # manual task
 
-    if all(m.status == "Completed" for m in task.milestones):
+    if task.milestone_completed == task.milestone_total:
         task.status = "Completed"
         task.completed_at = task.completed_at or datetime.utcnow()
-        db.commit()
 def update_milestone(db, milestone, title, deadline):
     milestone.title = title
     milestone.deadline = deadline
+    db.flush()
+    sync_milestone_counters(db, [milestone.task_id])
     db.commit()
+    invalidate_task(db, milestone.task.assigned_to_id)
 
 
 def delete_milestone(db, milestone):
+    task_id = milestone.task_id
+    assignee_id = milestone.task.assigned_to_id
     db.delete(milestone)
+    db.flush()
+    sync_milestone_counters(db, [task_id])
     db.commit()
+    invalidate_task(db, assignee_id)
 
 
 def move_milestone(db, milestone, direction: str):
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.user import User
+from app.services.analytics_service import task_analytics
+from app.services.dashboard_service import build_dashboard
+from app.services.kpi_service import build_kpis
+from app.services.report_service import report_page
+from app.utils.pagination import keyset_page
+from app.utils.task_visibility import apply_task_visibility
+
+
+WATCHED_TABLES = ("tasks", "task_milestones", "quick_tasks")
+
+
+def _hot_paths(db: Session, user):
+    build_dashboard(db, user)
+    build_kpis(db, user)
+
+    q = apply_task_visibility(db.query(Task).filter(Task.archived == False), user)
+    keyset_page(q, Task.final_deadline, Task.id, 50)
+    keyset_page(q, Task.final_deadline, Task.id, 50, after=(date.today(), 0))
+    keyset_page(q.filter(Task.status == "Submitted for Review"), Task.final_deadline, Task.id, 50)
+    keyset_page(q.filter(Task.assigned_to_id == user.id), Task.final_deadline, Task.id, 50)
+
+    # Reports: the tasks UNION quick-logs list and the weekly analytics
+    today = date.today()
+    report_page(db, {}, 1, 50)
+    report_page(db, {"from_date": today - timedelta(days=30), "to_date": today}, 1, 50)
+    task_analytics(db, user, {}, today=today)
+
+
+def _capture_statements(db: Session, users) -> list[tuple[str, object]]:
+    captured = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        for user in users:
+            _hot_paths(db, user)
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+    return captured
+
+
+def _full_scans(plan_lines: list[str]) -> list[str]:
+    scans = []
+    for line in plan_lines:
+        for table in WATCHED_TABLES:
+            # "SCAN tasks" without an index is a full table scan;
+            # "SCAN tasks USING INDEX ..." walks an index in order.
+            if f"SCAN {table}" in line and "USING" not in line:
+                scans.append(line)
+    return scans
+
+
+def explain_hot_queries(db: Session) -> list[dict]:
+    """
+    Run the dashboard, KPI, task-list, report-list and analytics queries
+    for an admin and a non-admin user, and return the SQLite query plan of every SELECT
+    they issue along with any full scans of the task tables.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        raise RuntimeError("check-indexes reads EXPLAIN QUERY PLAN and needs SQLite")
+
+    users = [
+        db.query(User).filter(User.role == "admin").first(),
+        db.query(User).filter(User.role != "admin").first(),
+    ]
+    users = [u for u in users if u]
+
+    results = []
+    seen = set()
+    for statement, parameters in _capture_statements(db, users):
+        if statement in seen:
+            continue
+        seen.add(statement)
+
+        rows = db.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+        plan = [row[-1] for row in rows]
+        results.append({
+            "statement": " ".join(statement.split()),
+            "plan": plan,
+            "full_scans": _full_scans(plan),
+        })
+
+    return results
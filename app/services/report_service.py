@@ -1,157 +1,505 @@
-from io import BytesIO
+from io import BytesIO, StringIO
+import csv
+import json
 import os
+from tempfile import SpooledTemporaryFile
 from datetime import datetime, date
+from types import SimpleNamespace
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.orm import Session
 from openpyxl import Workbook
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import (
+    BaseDocTemplate,
+    Frame,
+    Image,
+    LongTable,
+    PageBreak,
+    PageTemplate,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle
+)
+from xml.sax.saxutils import escape
+
+from app.config import settings
+from app.database import SessionLocal
 from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.milestone import TaskMilestone
 from app.models.quick_task import QuickTask
+from app.models.user import User
+
+
+# Every report view and export goes through one pipeline:
+#
+#   report_filters() -> iter_report_records() -> sink
+#
+# iter_report_records() selects only the columns a sink asks for, joining
+# users / task types / milestones only when one of their columns is needed,
+# and yields plain tuples. The sinks below (XLSX, PDF, CSV/NDJSON and the
+# HTML report list) only shape those tuples.
+
+
+# -------- FILTERS --------
+def report_filters(
+    status: str | None = None,
+    priority: str | None = None,
+    type_id: int | None = None,
+    assigned_to_id: int | None = None,
+    from_date: date | None = None,
+    to_date: date | None = None
+) -> dict:
+    return {
+        "status": status or None,
+        "priority": priority or None,
+        "type_id": type_id or None,
+        "assigned_to_id": assigned_to_id or None,
+        "from_date": from_date or None,
+        "to_date": to_date or None,
+    }
+
 
+def task_filter_conditions(filters: dict) -> list:
+    """
+    WHERE conditions for live tasks matching `filters` (see
+    report_filters); shared by the report list, exports and analytics.
+    """
+    conditions = [Task.archived == False]
+    if filters.get("status"):
+        conditions.append(Task.status == filters["status"])
+    if filters.get("priority"):
+        conditions.append(Task.priority == filters["priority"])
+    if filters.get("type_id"):
+        conditions.append(Task.type_id == filters["type_id"])
+    if filters.get("assigned_to_id"):
+        conditions.append(Task.assigned_to_id == filters["assigned_to_id"])
+    if filters.get("from_date"):
+        conditions.append(Task.final_deadline >= filters["from_date"])
+    if filters.get("to_date"):
+        conditions.append(Task.final_deadline <= filters["to_date"])
+    return conditions
 
-def _apply_filters(query, from_date, to_date, status):
-    if from_date:
-        query = query.filter(Task.final_deadline >= from_date)
-    if to_date:
-        query = query.filter(Task.final_deadline <= to_date)
-    if status:
-        query = query.filter(Task.status == status)
-    return query
 
+def _quick_conditions(filters: dict) -> list | None:
+    """
+    Quick logs count as completed tasks with no priority or type, so any
+    other status, priority or type filter excludes them (returns None).
+    """
+    status = filters.get("status")
+    if (status and status != "Completed") or filters.get("priority") or filters.get("type_id"):
+        return None
 
-# -------- EXCEL REPORT --------
-def generate_tasks_excel(
+    conditions = []
+    if filters.get("from_date"):
+        conditions.append(QuickTask.completed_on >= filters["from_date"])
+    if filters.get("to_date"):
+        conditions.append(QuickTask.completed_on <= filters["to_date"])
+    if filters.get("assigned_to_id"):
+        conditions.append(QuickTask.created_by_id == filters["assigned_to_id"])
+    return conditions
+
+
+# -------- PROJECTED RECORDS --------
+EXPORT_COLUMNS = [
+    "id",
+    "title",
+    "status",
+    "priority",
+    "assigned_to",
+    "deadline",
+    "folder",
+    "milestone",
+    "milestone_status",
+    "milestone_deadline",
+]
+MILESTONE_COLUMNS = {"milestone", "milestone_status", "milestone_deadline"}
+
+TASK_FIELDS = {
+    "id": Task.id,
+    "title": Task.title,
+    "status": Task.status,
+    "priority": Task.priority,
+    "assigned_to": User.username,
+    "deadline": Task.final_deadline,
+    "folder": Task.folder_link,
+    "type": TaskType.name,
+}
+MILESTONE_FIELDS = {
+    "milestone": TaskMilestone.title,
+    "milestone_status": TaskMilestone.status,
+    "milestone_deadline": TaskMilestone.deadline,
+}
+QUICK_FIELDS = {
+    "id": QuickTask.id,
+    "title": QuickTask.title,
+    "assigned_to": User.username,
+    "deadline": QuickTask.completed_on,
+}
+QUICK_CONSTANTS = {
+    "status": "Completed",
+    "priority": "Normal",
+    "folder": None,
+    "type": "Quick Log",
+}
+
+
+def _task_records(db: Session, where: list, fields: list[str], milestone_fields: list[str]):
+    stmt = select(
+        Task.id.label("record_id"),
+        *[TASK_FIELDS[f] for f in fields]
+    )
+    if "assigned_to" in fields:
+        stmt = stmt.outerjoin(User, User.id == Task.assigned_to_id)
+    if "type" in fields:
+        stmt = stmt.outerjoin(TaskType, TaskType.id == Task.type_id)
+
+    order = [Task.id]
+    if milestone_fields:
+        stmt = stmt.add_columns(
+            TaskMilestone.id.label("milestone_id"),
+            *[MILESTONE_FIELDS[f] for f in milestone_fields]
+        ).outerjoin(TaskMilestone, TaskMilestone.task_id == Task.id)
+        order.append(TaskMilestone.sequence)
+
+    stmt = stmt.where(*where).order_by(*order)
+    result = db.execute(stmt.execution_options(yield_per=settings.export_batch_size))
+
+    width = len(fields)
+    current = None
+    for row in result:
+        if current is None or current[1] != row[0]:
+            if current is not None:
+                yield current
+            current = ("task", row[0], tuple(row[1:1 + width]), [])
+        # The joined milestone row, if any: (milestone_id, *values)
+        if milestone_fields and row[1 + width] is not None:
+            current[3].append(tuple(row[2 + width:]))
+    if current is not None:
+        yield current
+
+
+def _quick_records(db: Session, where: list, fields: list[str]):
+    db_fields = [f for f in fields if f in QUICK_FIELDS]
+    stmt = select(QuickTask.id, *[QUICK_FIELDS[f] for f in db_fields])
+    if "assigned_to" in db_fields:
+        stmt = stmt.outerjoin(User, User.id == QuickTask.created_by_id)
+    stmt = stmt.where(*where).order_by(QuickTask.id)
+
+    result = db.execute(stmt.execution_options(yield_per=settings.export_batch_size))
+    for row in result:
+        values = dict(zip(db_fields, row[1:]))
+        yield (
+            "quick",
+            row[0],
+            tuple(values[f] if f in values else QUICK_CONSTANTS[f] for f in fields),
+            []
+        )
+
+
+def iter_report_records(
     db: Session,
-    from_date: date | None,
-    to_date: date | None,
-    status: str | None,
-    columns: list[str] | None = None
-) -> BytesIO:
+    fields: list[str],
+    milestone_fields: list[str] | None = None,
+    filters: dict | None = None,
+    task_ids: list[int] | None = None,
+    quick_ids: list[int] | None = None
+):
+    """
+    Yield (kind, ref_id, values, milestones) for every matching task and
+    then every quick log. `values` follows `fields`; each milestone is a
+    tuple following `milestone_fields`. Records come from `filters`, or
+    from explicit id lists when those are given.
+    """
+    milestone_fields = milestone_fields or []
+    filters = filters or {}
+
+    if task_ids is None:
+        task_where = task_filter_conditions(filters)
+    else:
+        task_where = [Task.id.in_(task_ids)] if task_ids else None
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Tasks Report"
-
-    column_labels = {
-        "id": "Task ID",
-        "title": "Title",
-        "status": "Status",
-        "priority": "Priority",
-        "assigned_to": "Assigned To",
-        "deadline": "Final Deadline",
-        "folder": "Folder",
-        "milestone": "Milestone",
-        "milestone_status": "Milestone Status",
-        "milestone_deadline": "Milestone Deadline",
-    }
-    if not columns:
-        columns = list(column_labels.keys())
+    if quick_ids is None:
+        quick_where = _quick_conditions(filters)
+    else:
+        quick_where = [QuickTask.id.in_(quick_ids)] if quick_ids else None
 
-    ws.append([column_labels[c] for c in columns])
+    if task_where is not None:
+        yield from _task_records(db, task_where, fields, milestone_fields)
+    if quick_where is not None:
+        yield from _quick_records(db, quick_where, fields)
 
-    query = db.query(Task).filter(Task.archived == False)
-    query = _apply_filters(query, from_date, to_date, status)
 
-    tasks = query.all()
+def iter_export_rows(db: Session, filters: dict, columns: list[str]):
+    """
+    Flatten records into export lines in `columns` order: one line per
+    task or quick log, followed by one line per milestone.
+    """
+    fields = [c for c in columns if c not in MILESTONE_COLUMNS]
+    milestone_fields = [c for c in columns if c in MILESTONE_COLUMNS]
 
-    quick_q = db.query(QuickTask)
-    if status and status != "Completed":
-        quick_tasks = []
-    else:
-        if from_date:
-            quick_q = quick_q.filter(QuickTask.completed_on >= from_date)
-        if to_date:
-            quick_q = quick_q.filter(QuickTask.completed_on <= to_date)
-        quick_tasks = quick_q.all()
-
-    milestone_columns = {"milestone", "milestone_status", "milestone_deadline"}
-    include_milestones = any(c in milestone_columns for c in columns)
-
-    def task_row(task, blank_milestones: bool):
-        values = {
-            "id": task.id,
-            "title": task.title,
-            "status": task.status,
-            "priority": task.priority,
-            "assigned_to": task.assigned_to.username if task.assigned_to else "-",
-            "deadline": task.final_deadline,
-            "folder": task.folder_link or "-",
-            "milestone": "" if blank_milestones else "-",
-            "milestone_status": "" if blank_milestones else "-",
-            "milestone_deadline": "" if blank_milestones else "-",
-        }
-        return [values[c] for c in columns]
-
-    def milestone_row(m):
-        values = {
-            "id": "",
-            "title": "",
-            "status": "",
-            "priority": "",
-            "assigned_to": "",
-            "deadline": "",
-            "folder": "",
-            "milestone": m.title,
-            "milestone_status": m.status,
-            "milestone_deadline": m.deadline,
-        }
-        return [values[c] for c in columns]
-
-    for task in tasks:
-        if task.milestones and include_milestones:
-            ws.append(task_row(task, blank_milestones=True))
-            for m in task.milestones:
-                ws.append(milestone_row(m))
-        else:
-            ws.append(task_row(task, blank_milestones=False))
-
-    for qt in quick_tasks:
-        values = {
-            "id": f"Q-{qt.id}",
-            "title": qt.title,
-            "status": "Completed",
-            "priority": "Normal",
-            "assigned_to": qt.created_by.username if qt.created_by else "-",
-            "deadline": qt.completed_on,
-            "folder": "-",
-            "milestone": "-",
-            "milestone_status": "-",
-            "milestone_deadline": "-",
-        }
-        ws.append([values[c] for c in columns])
-
-    output = BytesIO()
-    wb.save(output)
-    output.seek(0)
-    return output
+    for kind, ref_id, values, milestones in iter_report_records(
+        db, fields, milestone_fields, filters
+    ):
+        line = dict(zip(fields, values))
+        if kind == "quick" and "id" in line:
+            line["id"] = f"Q-{ref_id}"
+        if "assigned_to" in line:
+            line["assigned_to"] = line["assigned_to"] or "-"
+        if "folder" in line:
+            line["folder"] = line["folder"] or "-"
 
+        blank = "" if milestones else "-"
+        yield [line[c] if c in line else blank for c in columns]
 
-# -------- PDF REPORT --------
-def generate_tasks_pdf(
+        for m in milestones:
+            m_line = dict(zip(milestone_fields, m))
+            yield [m_line.get(c, "") for c in columns]
+
+
+# -------- CSV / NDJSON SINKS --------
+STREAM_FLUSH_ROWS = 200
+
+
+def _flat(value):
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _stream_columns(columns: list[str] | None) -> list[str]:
+    return [c for c in columns or [] if c in EXPORT_COLUMNS] or EXPORT_COLUMNS
+
+
+def _stream_rows(filters: dict, columns: list[str], header: str, encode_row):
+    # The response body outlives the request's get_db() session, so the
+    # stream owns its own session for as long as the client is reading.
+    db = SessionLocal()
+    try:
+        if header:
+            yield header
+
+        batch = []
+        for row in iter_export_rows(db, filters, columns):
+            batch.append(encode_row([_flat(v) for v in row]))
+            if len(batch) >= STREAM_FLUSH_ROWS:
+                yield "".join(batch)
+                batch = []
+        if batch:
+            yield "".join(batch)
+    finally:
+        db.close()
+
+
+def stream_tasks_csv(filters: dict, columns: list[str] | None = None):
+    columns = _stream_columns(columns)
+
+    def encode(values):
+        line = StringIO()
+        csv.writer(line).writerow(values)
+        return line.getvalue()
+
+    return _stream_rows(filters, columns, encode(columns), encode)
+
+
+def stream_tasks_ndjson(filters: dict, columns: list[str] | None = None):
+    columns = _stream_columns(columns)
+
+    def encode(values):
+        return json.dumps(dict(zip(columns, values)), ensure_ascii=False) + "\n"
+
+    return _stream_rows(filters, columns, "", encode)
+
+
+# -------- EXCEL SINK --------
+XLSX_COLUMN_LABELS = {
+    "id": "Task ID",
+    "title": "Title",
+    "status": "Status",
+    "priority": "Priority",
+    "assigned_to": "Assigned To",
+    "deadline": "Final Deadline",
+    "folder": "Folder",
+    "milestone": "Milestone",
+    "milestone_status": "Milestone Status",
+    "milestone_deadline": "Milestone Deadline",
+}
+
+
+def generate_tasks_excel(
     db: Session,
-    from_date: date | None,
-    to_date: date | None,
-    status: str | None,
+    filters: dict,
     columns: list[str] | None = None
-) -> BytesIO:
+) -> SpooledTemporaryFile:
+    """
+    Build the XLSX with a write-only workbook, so rows go to disk as they
+    are appended. The result is spooled in memory up to
+    settings.export_spool_max_bytes, then moves to a temp file.
+    """
+    if not columns:
+        columns = EXPORT_COLUMNS
 
-    buffer = BytesIO()
-    styles = getSampleStyleSheet()
-
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        leftMargin=36,
-        rightMargin=36,
-        topMargin=48,
-        bottomMargin=36
-    )
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Tasks Report")
+    ws.append([XLSX_COLUMN_LABELS[c] for c in columns])
+
+    for row in iter_export_rows(db, filters, columns):
+        ws.append(row)
+
+    output = SpooledTemporaryFile(max_size=settings.export_spool_max_bytes)
+    wb.save(output)
+    output.seek(0)
+    return output
 
-    elements = []
 
+# -------- PDF REPORT --------
+PDF_COLUMN_LABELS = {
+    "id": "ID",
+    "title": "Task",
+    "status": "Status",
+    "priority": "Priority",
+    "assigned_to": "Assigned To",
+    "deadline": "Deadline",
+    "folder": "Folder",
+    "milestone": "Milestone",
+    "milestone_status": "MS Status",
+    "milestone_deadline": "MS Deadline",
+}
+PDF_COLUMN_WIDTHS = {
+    "id": 24,
+    "title": 90,
+    "status": 55,
+    "priority": 45,
+    "assigned_to": 60,
+    "deadline": 55,
+    "folder": 90,
+    "milestone": 90,
+    "milestone_status": 50,
+    "milestone_deadline": 54,
+}
+PDF_WRAPPED_COLUMNS = {"title", "milestone"}
+PDF_FONT_SIZE = 7
+PDF_CELL_PADDING = 4
+
+PDF_LEADING = PDF_FONT_SIZE + 1.5
+PDF_HEADER_FONT_SIZE = 8
+PDF_HEADER_LEADING = PDF_HEADER_FONT_SIZE + 2
+PDF_CELL_VPADDING = 3
+PDF_PAGE_MARGINS = {"leftMargin": 36, "rightMargin": 36, "topMargin": 48, "bottomMargin": 36}
+PDF_FRAME_PADDING = 6
+# Head-room for rounding between the row-height estimate and the table's
+# own layout, so a page-sized chunk never spills onto the next page
+PDF_PAGE_SLACK = 4
+
+PDF_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f2d3d')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), PDF_HEADER_FONT_SIZE),
+    ('LEADING', (0, 0), (-1, 0), PDF_HEADER_LEADING),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 0.3, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+    ('FONTSIZE', (0, 1), (-1, -1), PDF_FONT_SIZE),
+    ('LEADING', (0, 1), (-1, -1), PDF_LEADING),
+    ('LEFTPADDING', (0, 0), (-1, -1), PDF_CELL_PADDING),
+    ('RIGHTPADDING', (0, 0), (-1, -1), PDF_CELL_PADDING),
+    ('TOPPADDING', (0, 0), (-1, -1), PDF_CELL_VPADDING),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), PDF_CELL_VPADDING),
+])
+
+_pdf_styles = None
+
+
+def _get_pdf_styles():
+    global _pdf_styles
+    if _pdf_styles is None:
+        styles = getSampleStyleSheet()
+        styles.add(ParagraphStyle(
+            "ReportCell",
+            parent=styles["BodyText"],
+            fontSize=PDF_FONT_SIZE,
+            leading=PDF_LEADING
+        ))
+        _pdf_styles = styles
+    return _pdf_styles
+
+
+def _pdf_cell(column: str, value, cell_style):
+    if value is None:
+        return "-"
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    text = str(value)
+    if column in PDF_WRAPPED_COLUMNS:
+        # Paragraph layout is the expensive part; only pay for it when
+        # the text would actually overflow the cell.
+        room = PDF_COLUMN_WIDTHS[column] - 2 * PDF_CELL_PADDING
+        if stringWidth(text, "Helvetica", PDF_FONT_SIZE) > room:
+            return Paragraph(escape(text), cell_style)
+    return text
+
+
+def _pdf_row_height(cells: list, col_widths: list[float], leading: float) -> float:
+    """
+    Height the table will give this row: the tallest cell plus padding.
+    Plain strings take one `leading` per line (the LEADING set in
+    PDF_TABLE_STYLE).
+    """
+    tallest = leading
+    for cell, width in zip(cells, col_widths):
+        if isinstance(cell, Paragraph):
+            _, height = cell.wrap(width - 2 * PDF_CELL_PADDING, 1_000_000)
+        else:
+            height = (cell.count("\n") + 1) * leading
+        tallest = max(tallest, height)
+    return tallest + 2 * PDF_CELL_VPADDING
+
+
+class _FlowableStream(list):
+    """
+    The flowable list handed to doc.build(), filled on demand from a
+    generator. build() only ever looks at the front of the list and
+    deletes flowables once drawn, so just a page or two of tables is
+    held in memory however long the report is.
+
+    build() documents a list argument but not how it walks it, so this
+    relies on reportlab internals: requirements.txt caps reportlab at
+    the tested series and tests/test_report_pdf.py checks the list never
+    fills up.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self, count: int):
+        while self._source is not None and super().__len__() < count:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill(2)
+        return super().__len__()
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and index >= 0:
+            self._fill(index + 1)
+        elif self._source is not None:
+            self._fill(float("inf"))
+        return super().__getitem__(index)
+
+
+def _pdf_report_intro(styles, filters: dict) -> list:
     logo_path = os.path.join("app", "static", "img", "uw-logo.png")
     header_cells = []
     if os.path.exists(logo_path):
@@ -171,170 +519,216 @@ def generate_tasks_pdf(
         ("LEFTPADDING", (0, 0), (-1, -1), 0),
         ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
     ]))
-    elements.append(header)
-    elements.append(
+    return [
+        header,
         Paragraph(
             f"Generated on: {datetime.now().strftime('%d-%b-%Y %H:%M')}",
             styles['Normal']
-        )
-    )
-    elements.append(
+        ),
         Paragraph(
-            f"Filters: From {from_date or '-'} | To {to_date or '-'} | Status {status or 'All'}",
+            f"Filters: From {filters.get('from_date') or '-'} | "
+            f"To {filters.get('to_date') or '-'} | "
+            f"Status {filters.get('status') or 'All'}",
             styles['Normal']
-        )
+        ),
+        Spacer(1, 12),
+    ]
+
+
+def _pdf_flowables(
+    rows,
+    columns: list[str],
+    intro: list,
+    frame_size: tuple[float, float],
+    cell_style,
+    single_table: bool
+):
+    """
+    Yield the intro, then one table per page: rows are measured as they
+    arrive and each table is cut just before it would overflow the frame
+    (`frame_size` is its usable width and height), followed by a page
+    break. Only the current page's rows are in memory.
+    """
+    frame_width, frame_height = frame_size
+    heading = [PDF_COLUMN_LABELS[c] for c in columns]
+    col_widths = [PDF_COLUMN_WIDTHS[c] for c in columns]
+    heading_height = _pdf_row_height(heading, col_widths, PDF_HEADER_LEADING)
+    page_height = frame_height - PDF_PAGE_SLACK
+
+    def table(body):
+        t = LongTable([heading] + body, colWidths=col_widths, repeatRows=1)
+        t.setStyle(PDF_TABLE_STYLE)
+        return t
+
+    available = page_height
+    for flowable in intro:
+        _, height = flowable.wrap(frame_width, frame_height)
+        available -= height + flowable.getSpaceBefore() + flowable.getSpaceAfter()
+        yield flowable
+
+    chunk = []
+    used = heading_height
+    for row in rows:
+        cells = [_pdf_cell(c, v, cell_style) for c, v in zip(columns, row)]
+        height = _pdf_row_height(cells, col_widths, PDF_LEADING)
+        if not single_table and chunk and used + height > available:
+            yield table(chunk)
+            yield PageBreak()
+            chunk = []
+            used = heading_height
+            available = page_height
+        chunk.append(cells)
+        used += height
+
+    if not chunk:
+        chunk = [["-"] * len(columns)]
+        chunk[0][min(1, len(columns) - 1)] = "No tasks found"
+    yield table(chunk)
+
+
+def render_tasks_pdf(
+    rows,
+    columns: list[str],
+    filters: dict | None = None,
+    single_table: bool = False
+) -> BytesIO:
+    """
+    PDF sink: lay out export rows (see iter_export_rows) as the task
+    report PDF, one frame-sized LongTable per page, built incrementally
+    from `rows`. single_table=True lays everything out as one table
+    (kept for benchmarking).
+    """
+    buffer = BytesIO()
+    styles = _get_pdf_styles()
+
+    doc = BaseDocTemplate(buffer, pagesize=A4, **PDF_PAGE_MARGINS)
+    doc.addPageTemplates([PageTemplate(frames=[Frame(
+        doc.leftMargin,
+        doc.bottomMargin,
+        doc.width,
+        doc.height,
+        leftPadding=PDF_FRAME_PADDING,
+        rightPadding=PDF_FRAME_PADDING,
+        topPadding=PDF_FRAME_PADDING,
+        bottomPadding=PDF_FRAME_PADDING
+    )])])
+    # Every page uses that one frame, so this is the room each table gets
+    frame_size = (
+        doc.width - 2 * PDF_FRAME_PADDING,
+        doc.height - 2 * PDF_FRAME_PADDING
     )
-    elements.append(Spacer(1, 12))
 
-    query = db.query(Task).filter(Task.archived == False)
-    query = _apply_filters(query, from_date, to_date, status)
+    doc.build(_FlowableStream(_pdf_flowables(
+        rows,
+        columns,
+        _pdf_report_intro(styles, filters or {}),
+        frame_size,
+        styles["ReportCell"],
+        single_table
+    )))
 
-    tasks = query.all()
+    buffer.seek(0)
+    return buffer
 
-    quick_q = db.query(QuickTask)
-    if status and status != "Completed":
-        quick_tasks = []
-    else:
-        if from_date:
-            quick_q = quick_q.filter(QuickTask.completed_on >= from_date)
-        if to_date:
-            quick_q = quick_q.filter(QuickTask.completed_on <= to_date)
-        quick_tasks = quick_q.all()
-
-    column_labels = {
-        "id": "ID",
-        "title": "Task",
-        "status": "Status",
-        "priority": "Priority",
-        "assigned_to": "Assigned To",
-        "deadline": "Deadline",
-        "folder": "Folder",
-        "milestone": "Milestone",
-        "milestone_status": "MS Status",
-        "milestone_deadline": "MS Deadline",
-    }
-    if not columns:
-        columns = list(column_labels.keys())
-
-    data = [[column_labels[c] for c in columns]]
-
-    body_style = styles['BodyText']
-
-    milestone_columns = {"milestone", "milestone_status", "milestone_deadline"}
-    include_milestones = any(c in milestone_columns for c in columns)
-
-    def task_row(task, blank_milestones: bool):
-        values = {
-            "id": str(task.id),
-            "title": Paragraph(task.title, body_style),
-            "status": task.status,
-            "priority": task.priority,
-            "assigned_to": task.assigned_to.username if task.assigned_to else "-",
-            "deadline": task.final_deadline.strftime("%Y-%m-%d") if task.final_deadline else "-",
-            "folder": task.folder_link or "-",
-            "milestone": "" if blank_milestones else "-",
-            "milestone_status": "" if blank_milestones else "-",
-            "milestone_deadline": "" if blank_milestones else "-",
-        }
-        return [values[c] for c in columns]
-
-    def milestone_row(m):
-        values = {
-            "id": "",
-            "title": "",
-            "status": "",
-            "priority": "",
-            "assigned_to": "",
-            "deadline": "",
-            "folder": "",
-            "milestone": Paragraph(m.title, body_style),
-            "milestone_status": m.status,
-            "milestone_deadline": m.deadline.strftime("%Y-%m-%d") if m.deadline else "-",
-        }
-        return [values[c] for c in columns]
-
-    if tasks:
-        for task in tasks:
-            if task.milestones and include_milestones:
-                data.append(task_row(task, blank_milestones=True))
-                for m in task.milestones:
-                    data.append(milestone_row(m))
-            else:
-                data.append(task_row(task, blank_milestones=False))
-
-    if quick_tasks:
-        for qt in quick_tasks:
-            values = {
-                "id": f"Q-{qt.id}",
-                "title": Paragraph(qt.title, body_style),
-                "status": "Completed",
-                "priority": "Normal",
-                "assigned_to": qt.created_by.username if qt.created_by else "-",
-                "deadline": qt.completed_on.strftime("%Y-%m-%d") if qt.completed_on else "-",
-                "folder": "-",
-                "milestone": "-",
-                "milestone_status": "-",
-                "milestone_deadline": "-",
-            }
-            data.append([values[c] for c in columns])
-    if not tasks and not quick_tasks:
-        data.append(['-', 'No tasks found', '-', '-', '-', '-', '-', '-', '-'])
-
-    col_widths_map = {
-        "id": 24,
-        "title": 90,
-        "status": 55,
-        "priority": 45,
-        "assigned_to": 60,
-        "deadline": 55,
-        "folder": 90,
-        "milestone": 90,
-        "milestone_status": 50,
-        "milestone_deadline": 54,
-    }
-    col_widths = [col_widths_map[c] for c in columns]
-    table = Table(data, colWidths=col_widths, repeatRows=1)
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f2d3d')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 8),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('GRID', (0, 0), (-1, -1), 0.3, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-        ('FONTSIZE', (0, 1), (-1, -1), 7),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-    ]))
 
-    elements.append(table)
-    doc.build(elements)
+def generate_tasks_pdf(
+    db: Session,
+    filters: dict,
+    columns: list[str] | None = None
+) -> BytesIO:
+    if not columns:
+        columns = EXPORT_COLUMNS
 
-    buffer.seek(0)
-    return buffer
+    return render_tasks_pdf(
+        iter_export_rows(db, filters, columns),
+        columns,
+        filters
+    )
 
-def get_filtered_tasks(db: Session, filters: dict):
-    query = db.query(Task).filter(Task.archived == False)
 
-    if filters.get("status"):
-        query = query.filter(Task.status == filters["status"])
+# -------- HTML SINK (REPORT LIST) --------
+HTML_FIELDS = ["title", "type", "status", "priority", "assigned_to", "deadline", "folder"]
+HTML_MILESTONE_FIELDS = ["milestone", "milestone_status", "milestone_deadline"]
+
+
+def _report_union(filters: dict):
+    """
+    One UNION ALL over tasks and quick logs carrying just (kind, ref_id,
+    sort_date), so ordering, paging and counting all happen in SQL.
+    """
+    merged = select(
+        literal(0).label("kind"),
+        Task.id.label("ref_id"),
+        Task.final_deadline.label("sort_date")
+    ).where(*task_filter_conditions(filters))
+
+    quick_where = _quick_conditions(filters)
+    if quick_where is not None:
+        merged = union_all(
+            merged,
+            select(
+                literal(1).label("kind"),
+                QuickTask.id.label("ref_id"),
+                QuickTask.completed_on.label("sort_date")
+            ).where(*quick_where)
+        )
 
-    if filters.get("priority"):
-        query = query.filter(Task.priority == filters["priority"])
+    return merged.subquery()
+
+
+def _html_item(kind: str, ref_id: int, values: tuple, milestones: list):
+    v = dict(zip(HTML_FIELDS, values))
+    return SimpleNamespace(
+        id=f"Q-{ref_id}" if kind == "quick" else ref_id,
+        title=v["title"],
+        type=SimpleNamespace(name=v["type"]) if v["type"] else None,
+        status=v["status"],
+        priority=v["priority"],
+        assigned_to=SimpleNamespace(username=v["assigned_to"]) if v["assigned_to"] else None,
+        final_deadline=v["deadline"],
+        folder_link=v["folder"],
+        milestones=[
+            SimpleNamespace(title=title, status=status, deadline=deadline)
+            for title, status, deadline in milestones
+        ],
+        is_quick=kind == "quick",
+        url="/ui/quick-tasks" if kind == "quick" else f"/ui/tasks/{ref_id}"
+    )
 
-    if filters.get("type_id"):
-        query = query.filter(Task.type_id == filters["type_id"])
 
-    if filters.get("assigned_to_id"):
-        query = query.filter(Task.assigned_to_id == filters["assigned_to_id"])
+def report_page(db: Session, filters: dict, page: int, per_page: int) -> tuple[list, int]:
+    """
+    Return (items, total) for one page of the merged report list, ordered
+    by deadline / completion date. Only the rows on the page are loaded.
+    """
+    merged = _report_union(filters)
 
-    if filters.get("from_date"):
-        query = query.filter(Task.final_deadline >= filters["from_date"])
+    total = db.execute(select(func.count()).select_from(merged)).scalar()
 
-    if filters.get("to_date"):
-        query = query.filter(Task.final_deadline <= filters["to_date"])
+    keys = db.execute(
+        select(merged.c.kind, merged.c.ref_id)
+        .order_by(
+            merged.c.sort_date.asc().nulls_first(),
+            merged.c.kind,
+            merged.c.ref_id
+        )
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    ).all()
+
+    records = {
+        (kind, ref_id): _html_item(kind, ref_id, values, milestones)
+        for kind, ref_id, values, milestones in iter_report_records(
+            db,
+            HTML_FIELDS,
+            HTML_MILESTONE_FIELDS,
+            task_ids=[ref_id for kind, ref_id in keys if kind == 0],
+            quick_ids=[ref_id for kind, ref_id in keys if kind == 1]
+        )
+    }
 
-    return query.order_by(Task.final_deadline.asc()).all()
+    items = [
+        records[("task" if kind == 0 else "quick", ref_id)]
+        for kind, ref_id in keys
+    ]
+    return items, total
@@ -0,0 +1,297 @@
+import re
+from types import SimpleNamespace
+
+from sqlalchemy import and_, column, func, literal_column, or_, select, table, text, true
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.task import Task
+from app.models.milestone import TaskMilestone
+from app.models.quick_task import QuickTask
+from app.utils.task_visibility import apply_task_visibility
+
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _hit(kind: str, ref_id: int, task_id: int | None, title: str, snippet: str, rank: float):
+    return SimpleNamespace(
+        kind=kind,
+        ref_id=ref_id,
+        task_id=task_id,
+        title=title,
+        snippet=snippet,
+        rank=rank,
+        url="/ui/quick-tasks" if kind == "quick" else f"/ui/tasks/{task_id}"
+    )
+
+
+# =========================
+# SQLite FTS5 backend
+# =========================
+# rowid = source id * 4 + kind code (1 task, 2 milestone, 3 quick log),
+# so triggers replace a single FTS row by rowid instead of scanning.
+FTS5_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind UNINDEXED,
+        ref_id UNINDEXED,
+        task_id UNINDEXED,
+        title,
+        body,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    # ---- tasks ----
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (
+            new.id * 4 + 1, 'task', new.id, new.id, new.title,
+            coalesce(new.description, '') || ' ' || coalesce(new.completion_remarks, '')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_au
+    AFTER UPDATE OF title, description, completion_remarks ON tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (
+            new.id * 4 + 1, 'task', new.id, new.id, new.title,
+            coalesce(new.description, '') || ' ' || coalesce(new.completion_remarks, '')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_tasks_ad AFTER DELETE ON tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+    END
+    """,
+    # ---- milestones ----
+    """
+    CREATE TRIGGER IF NOT EXISTS search_milestones_ai AFTER INSERT ON task_milestones BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'milestone', new.id, new.task_id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_milestones_au
+    AFTER UPDATE OF title, description, task_id ON task_milestones BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (new.id * 4 + 2, 'milestone', new.id, new.task_id, new.title, coalesce(new.description, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_milestones_ad AFTER DELETE ON task_milestones BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END
+    """,
+    # ---- quick logs ----
+    """
+    CREATE TRIGGER IF NOT EXISTS search_quick_tasks_ai AFTER INSERT ON quick_tasks BEGIN
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (new.id * 4 + 3, 'quick', new.id, NULL, new.title, coalesce(new.notes, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_quick_tasks_au
+    AFTER UPDATE OF title, notes ON quick_tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+        VALUES (new.id * 4 + 3, 'quick', new.id, NULL, new.title, coalesce(new.notes, ''));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_quick_tasks_ad AFTER DELETE ON quick_tasks BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+    END
+    """,
+]
+
+FTS5_REBUILD = [
+    "DELETE FROM search_index",
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+    SELECT id * 4 + 1, 'task', id, id, title,
+           coalesce(description, '') || ' ' || coalesce(completion_remarks, '')
+    FROM tasks
+    """,
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+    SELECT id * 4 + 2, 'milestone', id, task_id, title, coalesce(description, '')
+    FROM task_milestones
+    """,
+    """
+    INSERT INTO search_index(rowid, kind, ref_id, task_id, title, body)
+    SELECT id * 4 + 3, 'quick', id, NULL, title, coalesce(notes, '')
+    FROM quick_tasks
+    """,
+]
+
+
+SEARCH_INDEX = table(
+    "search_index",
+    column("kind"),
+    column("ref_id"),
+    column("task_id"),
+    column("title"),
+    column("body"),
+)
+
+
+def _fts5_query(terms: list[str]) -> str:
+    # Quote every token so user input can never inject FTS5 syntax;
+    # the trailing * gives prefix matching while typing.
+    return " ".join('"' + t.replace('"', '""') + '"*' for t in terms)
+
+
+class Fts5SearchBackend:
+    name = "fts5"
+
+    def install(self, engine: Engine):
+        with engine.begin() as conn:
+            for statement in FTS5_SCHEMA:
+                conn.execute(text(statement))
+
+            indexed = conn.execute(text("SELECT count(*) FROM search_index")).scalar()
+            if not indexed:
+                has_rows = conn.execute(text(
+                    "SELECT EXISTS(SELECT 1 FROM tasks) "
+                    "OR EXISTS(SELECT 1 FROM quick_tasks)"
+                )).scalar()
+                if has_rows:
+                    for statement in FTS5_REBUILD:
+                        conn.execute(text(statement))
+
+    def rebuild(self, db: Session) -> int:
+        for statement in FTS5_REBUILD:
+            db.execute(text(statement))
+        db.commit()
+        return db.execute(text("SELECT count(*) FROM search_index")).scalar()
+
+    def search(self, db: Session, user, terms: list[str], limit: int) -> list:
+        fts = literal_column("search_index")
+
+        visible_task_ids = apply_task_visibility(
+            db.query(Task.id).filter(Task.archived == False),
+            user
+        ).statement
+
+        quick_clause = true()
+        if user.role != "admin":
+            quick_clause = SEARCH_INDEX.c.ref_id.in_(
+                select(QuickTask.id).where(QuickTask.created_by_id == user.id)
+            )
+
+        rank = func.bm25(fts, 0, 0, 0, 10.0, 1.0).label("rank")
+
+        # Visibility is applied inside the ranked query, so LIMIT only
+        # ever cuts rows the user is allowed to see.
+        stmt = (
+            select(
+                SEARCH_INDEX.c.kind,
+                SEARCH_INDEX.c.ref_id,
+                SEARCH_INDEX.c.task_id,
+                SEARCH_INDEX.c.title,
+                func.snippet(fts, 4, "[", "]", "…", 12).label("snippet"),
+                rank
+            )
+            .where(fts.op("MATCH")(_fts5_query(terms)))
+            .where(or_(
+                and_(
+                    SEARCH_INDEX.c.kind.in_(["task", "milestone"]),
+                    SEARCH_INDEX.c.task_id.in_(visible_task_ids)
+                ),
+                and_(SEARCH_INDEX.c.kind == "quick", quick_clause)
+            ))
+            .order_by(rank)
+            .limit(limit)
+        )
+
+        return [
+            _hit(row.kind, row.ref_id, row.task_id, row.title, row.snippet or "", row.rank)
+            for row in db.execute(stmt)
+        ]
+
+
+# =========================
+# Portable fallback backend
+# =========================
+class LikeSearchBackend:
+    """
+    Used on databases without FTS5. Same interface and visibility rules,
+    ranked crudely (title matches first) via case-insensitive LIKE.
+    """
+    name = "like"
+
+    def install(self, engine: Engine):
+        return None
+
+    def rebuild(self, db: Session) -> int:
+        return 0
+
+    def search(self, db: Session, user, terms: list[str], limit: int) -> list:
+        def matches(*cols):
+            return [or_(*[c.ilike(f"%{t}%") for c in cols]) for t in terms]
+
+        hits = []
+
+        task_q = apply_task_visibility(
+            db.query(Task).filter(Task.archived == False),
+            user
+        ).filter(*matches(Task.title, Task.description, Task.completion_remarks))
+        for t in task_q.limit(limit):
+            hits.append(_hit("task", t.id, t.id, t.title, t.description or "", 0.0))
+
+        ms_q = apply_task_visibility(
+            db.query(TaskMilestone).join(TaskMilestone.task).filter(Task.archived == False),
+            user
+        ).filter(*matches(TaskMilestone.title, TaskMilestone.description))
+        for m in ms_q.limit(limit):
+            hits.append(_hit("milestone", m.id, m.task_id, m.title, m.description or "", 1.0))
+
+        quick_q = db.query(QuickTask).filter(*matches(QuickTask.title, QuickTask.notes))
+        if user.role != "admin":
+            quick_q = quick_q.filter(QuickTask.created_by_id == user.id)
+        for qt in quick_q.limit(limit):
+            hits.append(_hit("quick", qt.id, None, qt.title, qt.notes or "", 1.0))
+
+        hits.sort(key=lambda h: h.rank)
+        return hits[:limit]
+
+
+def _sqlite_has_fts5(engine: Engine) -> bool:
+    with engine.connect() as conn:
+        options = conn.exec_driver_sql("PRAGMA compile_options").scalars().all()
+    return "ENABLE_FTS5" in options
+
+
+def _select_backend(engine: Engine):
+    # Not every SQLite build ships FTS5; those fall back to LIKE
+    if engine.dialect.name == "sqlite" and _sqlite_has_fts5(engine):
+        return Fts5SearchBackend()
+    return LikeSearchBackend()
+
+
+_backend = None
+
+
+def get_search_backend(engine: Engine):
+    global _backend
+    if _backend is None:
+        _backend = _select_backend(engine)
+    return _backend
+
+
+def search(db: Session, user, query: str, limit: int = 50) -> list:
+    """
+    Ranked full-text search over tasks, milestones and quick logs,
+    restricted to what `user` may see.
+    """
+    terms = TOKEN_RE.findall(query or "")[:10]
+    if not user or not terms:
+        return []
+
+    return get_search_backend(db.get_bind()).search(db, user, terms, limit)
@@ -1,6 +1,12 @@
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 from datetime import date, datetime
 from app.models.task import Task
+from app.models.user import User
+from app.services.dashboard_cache import invalidate_task
+from app.utils.hierarchy import can_assign_task, get_auth_context
+from app.utils.permissions import can_edit_task
+from app.utils.workflow import can_complete_task, can_review_task, can_submit_for_review
 
 
 # =========================
@@ -40,6 +46,7 @@ def create_task(
     db.add(task)
     db.commit()
     db.refresh(task)
+    invalidate_task(db, task.assigned_to_id)
     return task
 
 
@@ -57,6 +64,8 @@ def update_task(
     folder_link: str | None = None,
     description: str | None = None
 ):
+    previous_assignee_id = task.assigned_to_id
+
     task.title = title
     task.type_id = type_id
     task.priority = priority
@@ -66,6 +75,7 @@ def update_task(
     task.description = description
 
     db.commit()
+    invalidate_task(db, previous_assignee_id, assigned_to_id)
 
 
 # =========================
@@ -74,6 +84,7 @@ def update_task(
 def archive_task(db: Session, task: Task):
     task.archived = True
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
 
 
 # =========================
@@ -85,16 +96,19 @@ def submit_for_review(db: Session, task: Task, submission_remarks: str | None =
         task.submission_remarks = submission_remarks.strip() or None
     task.submitted_at = datetime.utcnow()
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
 
 
 def approve_task(db: Session, task: Task):
     task.status = "Approved"
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
 
 
 def return_task(db: Session, task: Task):
     task.status = "Returned"
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
 
 
 def complete_task(db: Session, task: Task, completion_remarks: str | None = None):
@@ -103,3 +117,198 @@ def complete_task(db: Session, task: Task, completion_remarks: str | None = None
         task.completion_remarks = completion_remarks.strip() or None
     task.completed_at = datetime.utcnow()
     db.commit()
+    invalidate_task(db, task.assigned_to_id)
+
+
+# =========================
+# Bulk Operations
+# =========================
+PRIORITIES = ("Low", "Normal", "High")
+SUBMITTABLE_STATUSES = ("To Do", "In Progress", "Returned")
+
+
+def _in_scope(user, task) -> bool:
+    # Bulk requests only ever touch the caller's own or managed tasks
+    return get_auth_context(user).can_assign_to(task.assigned_to_id)
+
+
+def _can_complete_in_bulk(user, task) -> bool:
+    return (
+        not task.archived
+        and task.status != "Completed"
+        and can_complete_task(user, task)
+        and (user.role == "admin" or _in_scope(user, task))
+    )
+
+
+def _can_review_in_bulk(user, task) -> bool:
+    # can_review_task refuses the assignee; the UPDATE guard repeats it
+    return (
+        not task.archived
+        and task.assigned_to_id != user.id
+        and can_review_task(user, task)
+    )
+
+
+def _unchanged_assignees(found: dict, task_ids: list[int]):
+    """
+    WHERE clause matching `task_ids` only while each task still has the
+    assignee it had in the batched read the permissions were checked on.
+    """
+    by_assignee = {}
+    for task_id in task_ids:
+        by_assignee.setdefault(found[task_id].assigned_to_id, []).append(task_id)
+
+    return or_(*(
+        and_(
+            Task.id.in_(group),
+            Task.assigned_to_id.is_(None) if assignee_id is None
+            else Task.assigned_to_id == assignee_id
+        )
+        for assignee_id, group in by_assignee.items()
+    ))
+
+
+# operation -> (per-task permission check, guard re-checked by the UPDATE)
+BULK_RULES = {
+    "reassign": (can_edit_task, lambda user: [Task.archived == False, Task.status != "Completed"]),
+    "priority": (can_edit_task, lambda user: [Task.archived == False, Task.status != "Completed"]),
+    "archive": (can_edit_task, lambda user: [Task.archived == False, Task.status != "Completed"]),
+    "submit": (
+        lambda user, task: not task.archived and can_submit_for_review(user, task),
+        lambda user: [
+            Task.archived == False,
+            Task.assigned_to_id == user.id,
+            Task.status.in_(SUBMITTABLE_STATUSES)
+        ]
+    ),
+    "approve": (
+        _can_review_in_bulk,
+        lambda user: [
+            Task.archived == False,
+            Task.assigned_to_id != user.id,
+            Task.status == "Submitted for Review"
+        ]
+    ),
+    "return": (
+        _can_review_in_bulk,
+        lambda user: [
+            Task.archived == False,
+            Task.assigned_to_id != user.id,
+            Task.status == "Submitted for Review"
+        ]
+    ),
+    "complete": (
+        _can_complete_in_bulk,
+        lambda user: [Task.archived == False, Task.status != "Completed"] + (
+            [] if user.role == "admin" else [Task.status == "Approved"]
+        )
+    ),
+}
+BULK_OPERATIONS = tuple(BULK_RULES)
+
+
+def _bulk_values(db: Session, user, operation: str, value) -> dict:
+    now = datetime.utcnow()
+
+    if operation == "reassign":
+        if value is None:
+            return {"assigned_to_id": None}
+        try:
+            assignee_id = int(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid assignee") from exc
+        assignee = db.get(User, assignee_id)
+        if not assignee or not assignee.is_active or not can_assign_task(user, assignee):
+            raise ValueError("Cannot assign tasks to that user")
+        return {"assigned_to_id": assignee_id}
+
+    if operation == "priority":
+        if value not in PRIORITIES:
+            raise ValueError("Invalid priority")
+        return {"priority": value}
+
+    if operation == "archive":
+        return {"archived": True}
+    if operation == "submit":
+        return {"status": "Submitted for Review", "submitted_at": now}
+    if operation == "approve":
+        return {"status": "Approved"}
+    if operation == "return":
+        return {"status": "Returned"}
+    return {"status": "Completed", "completed_at": now}
+
+
+def bulk_update_tasks(db: Session, user, task_ids: list[int], operation: str, value=None) -> dict:
+    """
+    Apply one operation to many tasks in a single transaction: permissions
+    are checked per task against one batched read, and every permitted
+    task is changed by one UPDATE whose WHERE clause re-checks the state
+    and the assignee that was read, so tasks changed or reassigned
+    concurrently are reported rather than overwritten.
+
+    Raises ValueError for an unknown operation or an invalid value.
+    """
+    if operation not in BULK_RULES:
+        raise ValueError("Unknown operation")
+
+    check, guard = BULK_RULES[operation]
+    values = _bulk_values(db, user, operation, value)
+    ids = list(dict.fromkeys(task_ids))
+
+    found = {
+        row.id: row
+        for row in db.execute(
+            select(Task.id, Task.assigned_to_id, Task.status, Task.archived)
+            .where(Task.id.in_(ids))
+        )
+    } if ids else {}
+
+    errors = {}
+    permitted = []
+    for task_id in ids:
+        row = found.get(task_id)
+        if row is None:
+            errors[task_id] = "not found"
+        elif not check(user, row):
+            errors[task_id] = "not permitted"
+        else:
+            permitted.append(task_id)
+
+    updated = set()
+    if permitted:
+        updated = set(
+            db.execute(
+                update(Task)
+                .where(_unchanged_assignees(found, permitted), *guard(user))
+                .values(**values)
+                .returning(Task.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        )
+    db.commit()
+
+    if updated:
+        invalidate_task(
+            db,
+            values.get("assigned_to_id"),
+            *{found[task_id].assigned_to_id for task_id in updated}
+        )
+
+    results = []
+    for task_id in ids:
+        if task_id in updated:
+            results.append({"id": task_id, "ok": True})
+        else:
+            results.append({
+                "id": task_id,
+                "ok": False,
+                "error": errors.get(task_id, "changed by another request"),
+            })
+
+    return {
+        "operation": operation,
+        "requested": len(ids),
+        "updated": len(updated),
+        "results": results,
+    }
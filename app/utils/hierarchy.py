@@ -1,31 +1,141 @@
-def get_all_subordinate_ids(user):
+from sqlalchemy import select
+from sqlalchemy.orm import object_session
+
+from app.models.user_hierarchy import UserHierarchy
+
+
+def subordinate_ids_query(manager_id: int):
     """
-    Safely collect all subordinate user IDs under a user.
-    Works even if relationships are not yet loaded.
+    Ids of every user below `manager_id`, read from the user_hierarchy
+    closure table. Usable directly as an IN/semi-join subquery.
     """
+    return select(UserHierarchy.descendant_id).where(
+        UserHierarchy.ancestor_id == manager_id,
+        UserHierarchy.depth > 0
+    )
 
-    if not user:
-        return []
 
+def _collect_loaded(user):
     ids = []
+    seen = {user.id}
+    stack = [user]
 
-    def collect(u):
-        subs = getattr(u, "subordinates", None)
-
+    while stack:
+        subs = getattr(stack.pop(), "subordinates", None)
         if not subs:
-            return
+            continue
 
         if not isinstance(subs, (list, tuple, set)):
             subs = [subs]
 
         for sub in subs:
+            if sub.id in seen:
+                continue
+            seen.add(sub.id)
             ids.append(sub.id)
-            collect(sub)
+            stack.append(sub)
 
-    collect(user)
     return ids
 
 
+class AuthContext:
+    """
+    Request-scoped view of the current user's place in the hierarchy.
+    The subordinate set is resolved once and shared by every permission
+    and visibility check made while handling the request.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._subordinate_ids = None
+
+    @property
+    def is_admin(self) -> bool:
+        return self.user.role == "admin"
+
+    @property
+    def subordinate_ids(self) -> frozenset[int]:
+        if self._subordinate_ids is None:
+            # Cached principals carry the request's session as .db
+            db = getattr(self.user, "db", None) or object_session(self.user)
+            if db is None:
+                ids = _collect_loaded(self.user)
+            else:
+                ids = db.execute(subordinate_ids_query(self.user.id)).scalars()
+            self._subordinate_ids = frozenset(ids)
+        return self._subordinate_ids
+
+    def manages(self, user_id: int | None) -> bool:
+        return user_id is not None and user_id in self.subordinate_ids
+
+    def can_assign_to(self, user_id: int | None) -> bool:
+        if user_id is None:
+            return False
+        return self.is_admin or user_id == self.user.id or self.manages(user_id)
+
+    # -------- Task checks --------
+    # Only task columns are read (never task.assigned_to), so these work
+    # on ORM tasks and on plain rows alike.
+    def can_edit(self, task) -> bool:
+        if task.archived or task.status == "Completed":
+            return False
+        return (
+            self.is_admin
+            or task.assigned_to_id == self.user.id
+            or self.manages(task.assigned_to_id)
+        )
+
+    def can_review(self, task) -> bool:
+        # Reviewers are admins or managers above the assignee; the
+        # assignee never reviews their own submission
+        if task.assigned_to_id is None or task.assigned_to_id == self.user.id:
+            return False
+        return (
+            task.status == "Submitted for Review"
+            and (self.is_admin or self.manages(task.assigned_to_id))
+        )
+
+    def editable_task_ids(self, tasks) -> set[int]:
+        """
+        Batch form of can_edit for list views: "which of these tasks can
+        the user edit", answered from the one resolved subordinate set.
+        """
+        return {task.id for task in tasks if self.can_edit(task)}
+
+    def reviewable_task_ids(self, tasks) -> set[int]:
+        # Batch form of can_review for list views
+        return {task.id for task in tasks if self.can_review(task)}
+
+
+def get_auth_context(user) -> AuthContext | None:
+    """
+    Return the AuthContext bound to this user instance, creating it on
+    first use. User instances are loaded per request, so the memo lives
+    exactly as long as the request does.
+    """
+    if not user:
+        return None
+
+    ctx = getattr(user, "_auth_context", None)
+    if ctx is None:
+        ctx = AuthContext(user)
+        user._auth_context = ctx
+    return ctx
+
+
+def get_all_subordinate_ids(user):
+    """
+    Safely collect all subordinate user IDs under a user.
+    Resolved from the closure table when the user is attached to a
+    session; detached users fall back to walking loaded relationships.
+    """
+
+    if not user:
+        return []
+
+    return list(get_auth_context(user).subordinate_ids)
+
+
 def can_assign_task(assigner, assignee):
     """
     Admin can assign to anyone.
@@ -34,10 +144,4 @@ def can_assign_task(assigner, assignee):
     if not assigner or not assignee:
         return False
 
-    if assigner.role == "admin":
-        return True
-
-    if assigner.id == assignee.id:
-        return True
-
-    return assignee.id in get_all_subordinate_ids(assigner)
+    return get_auth_context(assigner).can_assign_to(assignee.id)
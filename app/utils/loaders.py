@@ -0,0 +1,40 @@
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from app.models.task import Task
+from app.models.milestone import TaskMilestone
+
+
+# =========================
+# Loader profiles per view
+# =========================
+# Each profile loads exactly what the view reads, so a page costs a fixed
+# number of queries however many rows it shows. Many-to-one lookups are
+# joined; collections use a single selectin query per page. Reports and
+# exports don't load ORM objects at all; see the projected pipeline in
+# report_service.
+
+def task_list_options():
+    """tasks/list.html: type name and milestones per row."""
+    return (
+        joinedload(Task.type),
+        selectinload(Task.milestones),
+    )
+
+
+def dashboard_task_options():
+    """dashboard.html: scalar columns only, no relationships."""
+    return (
+        load_only(Task.id, Task.title, Task.status, Task.final_deadline),
+    )
+
+
+def dashboard_milestone_options():
+    return (
+        load_only(
+            TaskMilestone.id,
+            TaskMilestone.task_id,
+            TaskMilestone.title,
+            TaskMilestone.status,
+            TaskMilestone.deadline
+        ),
+    )
@@ -0,0 +1,105 @@
+import base64
+import threading
+import time
+from datetime import date
+
+from sqlalchemy import and_, or_
+
+
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(deadline: date, row_id: int) -> str:
+    raw = f"{deadline.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str | None) -> tuple[date, int] | None:
+    if not value:
+        return None
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        deadline_raw, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return date.fromisoformat(deadline_raw), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def clamp_page_size(value: int | None, default: int) -> int:
+    if not value or value < 1:
+        return default
+    return min(value, MAX_PAGE_SIZE)
+
+
+def keyset_page(query, deadline_col, id_col, page_size: int, after=None, before=None):
+    """
+    Fetch one page ordered by (deadline_col, id_col) using keyset seeks,
+    so page cost does not depend on how deep the cursor is.
+
+    Returns (rows, next_cursor, prev_cursor); cursors are None at the ends.
+    """
+    if before:
+        deadline, row_id = before
+        rows = (
+            query.filter(or_(
+                deadline_col < deadline,
+                and_(deadline_col == deadline, id_col < row_id)
+            ))
+            .order_by(deadline_col.desc(), id_col.desc())
+            .limit(page_size + 1)
+            .all()
+        )
+        has_prev = len(rows) > page_size
+        rows = list(reversed(rows[:page_size]))
+        has_next = True
+    else:
+        if after:
+            deadline, row_id = after
+            query = query.filter(or_(
+                deadline_col > deadline,
+                and_(deadline_col == deadline, id_col > row_id)
+            ))
+        rows = (
+            query.order_by(deadline_col.asc(), id_col.asc())
+            .limit(page_size + 1)
+            .all()
+        )
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        has_prev = after is not None
+
+    def cursor_of(row):
+        return encode_cursor(
+            getattr(row, deadline_col.key),
+            getattr(row, id_col.key)
+        )
+
+    next_cursor = cursor_of(rows[-1]) if rows and has_next else None
+    prev_cursor = cursor_of(rows[0]) if rows and has_prev else None
+    return rows, next_cursor, prev_cursor
+
+
+_count_lock = threading.Lock()
+_count_cache: dict[tuple, tuple[float, int]] = {}
+
+
+def cached_count(key: tuple, query, ttl_seconds: int) -> int:
+    """
+    COUNT(*) for `query`, memoized for `ttl_seconds` under `key`.
+    A ttl of 0 disables caching.
+    """
+    now = time.monotonic()
+    if ttl_seconds > 0:
+        with _count_lock:
+            entry = _count_cache.get(key)
+        if entry and now - entry[0] < ttl_seconds:
+            return entry[1]
+
+    total = query.order_by(None).count()
+
+    if ttl_seconds > 0:
+        with _count_lock:
+            if len(_count_cache) > 10000:
+                _count_cache.clear()
+            _count_cache[key] = (now, total)
+    return total
@@ -15,26 +15,13 @@ def require_admin(user: User):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
-from app.utils.hierarchy import can_assign_task
+from app.utils.hierarchy import get_auth_context
 
 
 def can_edit_task(user, task):
+    # Admins, the assignee and managers above the assignee, never on
+    # completed or archived tasks (see AuthContext.can_edit)
     if not user or not task:
         return False
 
-    if task.archived or task.status == "Completed":
-        return False
-
-    # Admin override
-    if user.role == "admin":
-        return True
-
-    # Assigned user can edit
-    if task.assigned_to_id == user.id:
-        return True
-
-    # Manager can edit subordinate tasks (except completed/archived)
-    if task.assigned_to and can_assign_task(user, task.assigned_to):
-        return True
-
-    return False
+    return get_auth_context(user).can_edit(task)
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user import User
+from app.utils.privileges import user_privilege_masks
+
+
+# What get_principal returns: a plain namespace, not a User row
+Principal = SimpleNamespace
+
+# Safety net for multi-worker deployments, mirroring app/utils/ui_cache.py:
+# a bump only reaches the worker that handled the write.
+MAX_AGE_SECONDS = 60
+
+_lock = threading.Lock()
+_entries: OrderedDict[tuple[int, int], tuple[float, dict | None]] = OrderedDict()
+_security_versions: dict[int, int] = defaultdict(int)
+
+
+def bump_security_version(user_id: int):
+    """
+    Drop the cached principal for `user_id`.
+    Call after committing changes to a user's role, department, manager,
+    privileges or active flag.
+    """
+    with _lock:
+        _entries.pop((user_id, _security_versions[user_id]), None)
+        _security_versions[user_id] += 1
+
+
+def clear_principal_cache():
+    with _lock:
+        _entries.clear()
+
+
+def _load_principal(db: Session, user_id: int) -> dict | None:
+    row = db.execute(
+        select(
+            User.id,
+            User.username,
+            User.full_name,
+            User.role,
+            User.department,
+            User.manager_id
+        ).where(User.id == user_id, User.is_active == True)
+    ).first()
+    if row is None:
+        return None
+
+    mask = user_privilege_masks(db, [user_id]).get(user_id, 0)
+    return {**row._asdict(), "privilege_mask": mask}
+
+
+def get_principal(db: Session, user_id: int) -> Principal | None:
+    """
+    The authenticated user as a detached, request-scoped object carrying
+    id, username, full_name, role, department, manager_id and
+    privilege_mask (see app/utils/privileges.py). Served from an LRU
+    keyed by (user id, security version); `db` is only queried on a miss,
+    and is attached as `principal.db` for checks that need the hierarchy.
+    Inactive or unknown users give None.
+    """
+    now = time.monotonic()
+    with _lock:
+        key = (user_id, _security_versions[user_id])
+        entry = _entries.get(key)
+        if entry is not None and now - entry[0] < MAX_AGE_SECONDS:
+            _entries.move_to_end(key)
+            data = entry[1]
+        else:
+            entry = None
+
+    if entry is None:
+        data = _load_principal(db, user_id)
+        with _lock:
+            # A bump while loading makes this result stale; serve it for
+            # this request but do not cache it.
+            if key[1] == _security_versions[user_id]:
+                _entries[key] = (time.monotonic(), data)
+                _entries.move_to_end(key)
+                while len(_entries) > settings.principal_cache_size:
+                    _entries.popitem(last=False)
+
+    if data is None:
+        return None
+
+    # A fresh object per request, so request-scoped memos such as the
+    # AuthContext never outlive the request.
+    return SimpleNamespace(**data, db=db)
@@ -1,8 +1,113 @@
-def has_privilege(user, code: str) -> bool:
+import threading
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.privilege import Privilege
+from app.models.user_privilege import user_privileges
+
+
+# Privilege codes map to bit positions by primary key, so a mask built
+# before a privilege was added stays valid after the map is refreshed.
+MAX_AGE_SECONDS = 60
+
+_lock = threading.Lock()
+_bits: dict[str, int] | None = None
+_loaded_at = 0.0
+
+
+def bump_privilege_map():
+    """
+    Mark the code -> bit map as stale.
+    Call after committing changes to the privileges table (assignments
+    to users go through principal_cache.bump_security_version instead).
+    """
+    global _bits
+    with _lock:
+        _bits = None
+
+
+def privilege_bit(privilege_id: int) -> int:
+    return 1 << privilege_id
+
+
+def _privilege_bits(session_factory=SessionLocal) -> dict[str, int]:
+    global _bits, _loaded_at
+    bits = _bits
+    if bits is not None and time.monotonic() - _loaded_at < MAX_AGE_SECONDS:
+        return bits
+
+    with _lock:
+        if _bits is not None and time.monotonic() - _loaded_at < MAX_AGE_SECONDS:
+            return _bits
+
+        db = session_factory()
+        try:
+            rows = db.execute(select(Privilege.code, Privilege.id)).all()
+        finally:
+            db.close()
+
+        _bits = {code: privilege_bit(privilege_id) for code, privilege_id in rows}
+        _loaded_at = time.monotonic()
+        return _bits
+
+
+def privilege_mask(*codes: str) -> int:
+    """
+    Combined bit mask for `codes`; unknown codes contribute no bits.
+    Build it once and pass it to has_privileges for bulk checks.
+    """
+    bits = _privilege_bits()
+    mask = 0
+    for code in codes:
+        mask |= bits.get(code, 0)
+    return mask
+
+
+def privilege_codes(mask: int) -> list[str]:
+    # Codes set in `mask`, in code order
+    return sorted(code for code, bit in _privilege_bits().items() if mask & bit)
+
+
+def user_privilege_masks(db: Session, user_ids=None) -> dict[int, int]:
+    """
+    Privilege masks for `user_ids` (every user when None) from a single
+    query over user_privileges. Users without privileges are left out.
+    """
+    stmt = select(user_privileges.c.user_id, user_privileges.c.privilege_id)
+    if user_ids is not None:
+        stmt = stmt.where(user_privileges.c.user_id.in_(user_ids))
+
+    masks: dict[int, int] = {}
+    for user_id, privilege_id in db.execute(stmt):
+        masks[user_id] = masks.get(user_id, 0) | privilege_bit(privilege_id)
+    return masks
+
+
+def user_privilege_mask(user) -> int:
+    # Cached principals carry the mask; ORM users are folded on demand
+    mask = getattr(user, "privilege_mask", None)
+    if mask is None:
+        mask = 0
+        for p in user.privileges:
+            mask |= privilege_bit(p.id)
+    return mask
+
+
+def has_privileges(user, mask: int) -> bool:
+    """
+    True when `user` holds every privilege in `mask` (admins hold all).
+    """
     if not user:
         return False
 
     if user.role == "admin":
         return True
 
-    return any(p.code == code for p in user.privileges)
+    return mask != 0 and user_privilege_mask(user) & mask == mask
+
+
+def has_privilege(user, code: str) -> bool:
+    return has_privileges(user, privilege_mask(code))
@@ -1,8 +1,19 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from app.config import settings
+
+# Hashes made with other cost parameters still verify; needs_update()
+# flags them so they are rehashed on the next successful login.
 pwd_context = CryptContext(
     schemes=["argon2"],
-    deprecated="auto"
+    deprecated="auto",
+    argon2__rounds=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism
 )
 
 def hash_password(password: str) -> str:
@@ -10,3 +21,76 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, password_hash: str) -> bool:
     return pwd_context.verify(password, password_hash)
+
+def verify_and_update(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """
+    (matches, new_hash); new_hash is set only when the password matches
+    and the stored hash was made with outdated parameters.
+    """
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+# =========================
+# Bounded hashing pool
+# =========================
+# argon2 releases the GIL, so a small thread pool runs hashes in
+# parallel without tying up the request threadpool. At most
+# workers + queue verifications are admitted at once.
+class PasswordHashBusy(Exception):
+    pass
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(
+    settings.password_hash_workers + settings.password_hash_queue
+)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.password_hash_workers,
+                thread_name_prefix="password-hash"
+            )
+        return _executor
+
+
+def shutdown_password_hashing():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def verify_and_update_bounded(
+    password: str,
+    password_hash: str
+) -> tuple[bool, str | None]:
+    """
+    verify_and_update() on the hashing pool. Raises PasswordHashBusy when
+    the queue is full or the result takes longer than
+    settings.password_hash_timeout_seconds.
+    """
+    if not _slots.acquire(blocking=False):
+        raise PasswordHashBusy("Too many sign-ins in progress")
+
+    try:
+        future = _get_executor().submit(verify_and_update, password, password_hash)
+    except BaseException:
+        _slots.release()
+        raise
+    # The slot is held until the hash finishes, even after a timeout,
+    # so abandoned work still counts against the bound.
+    future.add_done_callback(lambda f: _slots.release())
+
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            timeout=settings.password_hash_timeout_seconds
+        )
+    except asyncio.TimeoutError as exc:
+        raise PasswordHashBusy("Sign-in timed out") from exc
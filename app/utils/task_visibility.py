@@ -1,11 +1,12 @@
 from sqlalchemy import and_, or_
 from app.models.task import Task
-from app.utils.hierarchy import get_all_subordinate_ids
+from app.utils.hierarchy import subordinate_ids_query
 
 
-def apply_task_visibility(query, user):
+def task_visibility_clause(user):
     """
-    Scope task queries to what the current user should see.
+    WHERE clause limiting tasks to what the current user should see, or
+    None when nothing needs filtering.
     Rules:
     - Admin: all tasks
     - Non-admin:
@@ -13,20 +14,27 @@ def apply_task_visibility(query, user):
       - Subordinate tasks only when they are "Submitted for Review"
     """
     if not user or user.role == "admin":
-        return query
-
-    subordinate_ids = get_all_subordinate_ids(user)
+        return None
 
     own_clause = and_(
         Task.assigned_to_id == user.id,
         Task.status != "Submitted for Review"
     )
 
-    if subordinate_ids:
-        review_clause = and_(
-            Task.assigned_to_id.in_(subordinate_ids),
-            Task.status == "Submitted for Review"
-        )
-        return query.filter(or_(own_clause, review_clause))
+    # Semi-join against the closure table instead of a literal id list
+    review_clause = and_(
+        Task.status == "Submitted for Review",
+        Task.assigned_to_id.in_(subordinate_ids_query(user.id))
+    )
+    return or_(own_clause, review_clause)
+
 
-    return query.filter(own_clause)
+def apply_task_visibility(query, user):
+    """
+    Scope task queries to what the current user should see
+    (see task_visibility_clause).
+    """
+    clause = task_visibility_clause(user)
+    if clause is None:
+        return query
+    return query.filter(clause)
@@ -0,0 +1,119 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from sqlalchemy.orm import Session
+
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.models.app_setting import AppSetting
+from app.utils.theme import BUTTON_COLOR_DEFAULTS, sanitize_hex_color
+
+
+# Safety net for multi-worker deployments: a bump only reaches the worker
+# that handled the write, so other workers rebuild after this many seconds.
+MAX_AGE_SECONDS = 60
+
+_lock = threading.Lock()
+_version = 0
+_cache: dict[str, tuple[int, float, dict]] = {}
+
+
+def bump_version():
+    """
+    Mark the cached lookups as stale.
+    Call after committing changes to task types, users or UI settings.
+    """
+    global _version
+    with _lock:
+        _version += 1
+
+
+def get_version() -> int:
+    return _version
+
+
+def _load_filters(db: Session) -> dict:
+    task_types = [
+        SimpleNamespace(id=t.id, name=t.name, department=t.department)
+        for t in (
+            db.query(TaskType)
+            .filter(TaskType.is_active == True)
+            .all()
+        )
+    ]
+    users = [
+        SimpleNamespace(
+            id=u.id,
+            username=u.username,
+            full_name=u.full_name,
+            department=u.department
+        )
+        for u in (
+            db.query(User)
+            .filter(User.is_active == True)
+            .all()
+        )
+    ]
+    return {"task_types": task_types, "users": users}
+
+
+def _load_theme(db: Session) -> dict:
+    keys = ["ui_theme"] + list(BUTTON_COLOR_DEFAULTS.keys())
+    settings_map = {
+        item.key: item.value
+        for item in db.query(AppSetting).filter(AppSetting.key.in_(keys)).all()
+    }
+    return {
+        "ui_theme": settings_map.get("ui_theme") or "classic",
+        "ui_button_colors": {
+            key: sanitize_hex_color(settings_map.get(key), default)
+            for key, default in BUTTON_COLOR_DEFAULTS.items()
+        },
+    }
+
+
+def _is_fresh(entry, version: int, now: float) -> bool:
+    return (
+        entry is not None
+        and entry[0] == version
+        and now - entry[1] < MAX_AGE_SECONDS
+    )
+
+
+def _get_cached(name: str, loader, session_factory) -> dict:
+    now = time.monotonic()
+    entry = _cache.get(name)
+    if _is_fresh(entry, _version, now):
+        return entry[2]
+
+    with _lock:
+        version = _version
+        entry = _cache.get(name)
+        if _is_fresh(entry, version, now):
+            return entry[2]
+
+        db = session_factory()
+        try:
+            data = loader(db)
+        finally:
+            db.close()
+
+        _cache[name] = (version, time.monotonic(), data)
+        return data
+
+
+def get_filter_lookups(session_factory) -> dict:
+    """
+    Active task types and users for the report/task filter bars.
+    Served from memory until the version is bumped or the entry ages out;
+    `session_factory` is only called on a rebuild.
+    """
+    return _get_cached("filters", _load_filters, session_factory)
+
+
+def get_theme_settings(session_factory) -> dict:
+    """
+    UI theme name and sanitized button colours, cached like the filters.
+    """
+    return _get_cached("theme", _load_theme, session_factory)
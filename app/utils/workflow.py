@@ -1,4 +1,4 @@
-from app.utils.hierarchy import can_assign_task
+from app.utils.hierarchy import get_auth_context
 
 
 def can_submit_for_review(user, task):
@@ -8,10 +8,10 @@ def can_submit_for_review(user, task):
 
 
 def can_review_task(user, task):
-    if not task.assigned_to:
+    if not user or not task:
         return False
 
-    return can_assign_task(user, task.assigned_to) and task.status == "Submitted for Review"
+    return get_auth_context(user).can_review(task)
 
 
 def can_complete_task(user, task):
@@ -0,0 +1,110 @@
+# manage.py
+import argparse
+import os
+import sys
+
+from sqlalchemy.orm import Session
+
+import app.main  # noqa: F401  (applies schema updates and first-run seeding)
+from app.config import settings
+from app.database import engine
+
+from app.services.benchmark_service import benchmark_login, benchmark_pdf
+from app.services.hierarchy_service import rebuild_hierarchy, verify_hierarchy
+from app.services.milestone_service import milestone_counter_drift, sync_milestone_counters
+from app.services.query_plan_service import explain_hot_queries
+from app.services.search_service import get_search_backend
+
+
+def _rebuild_hierarchy(db: Session) -> int:
+    result = rebuild_hierarchy(db)
+    print(f"user_hierarchy rebuilt: {result['rows']} rows")
+    if result["cyclic_user_ids"]:
+        print(f"manager cycles detected for users: {result['cyclic_user_ids']}")
+        return 1
+    return 0
+
+
+def _verify_hierarchy(db: Session) -> int:
+    result = verify_hierarchy(db)
+    if result["ok"]:
+        print("user_hierarchy OK")
+        return 0
+
+    print(f"missing rows: {result['missing']}")
+    print(f"unexpected rows: {result['unexpected']}")
+    if result["cyclic_user_ids"]:
+        print(f"manager cycles detected for users: {result['cyclic_user_ids']}")
+    return 1
+
+
+def _check_indexes(db: Session) -> int:
+    failures = 0
+    for result in explain_hot_queries(db):
+        status = "FULL SCAN" if result["full_scans"] else "ok"
+        print(f"[{status}] {result['statement'][:120]}")
+        for line in result["plan"]:
+            print(f"    {line}")
+        if result["full_scans"]:
+            failures += 1
+
+    print(f"{failures} quer{'y' if failures == 1 else 'ies'} with full scans")
+    return 1 if failures else 0
+
+
+def _rebuild_search(db: Session) -> int:
+    backend = get_search_backend(engine)
+    rows = backend.rebuild(db)
+    print(f"search index ({backend.name}) rebuilt: {rows} rows")
+    return 0
+
+
+def _repair_milestone_counters(db: Session) -> int:
+    drifted = milestone_counter_drift(db)
+    if drifted:
+        print(f"stale milestone counters on tasks: {drifted}")
+    sync_milestone_counters(db)
+    db.commit()
+    print(f"milestone counters recomputed ({len(drifted)} repaired)")
+    return 0
+
+
+def _benchmark_pdf(db: Session) -> int:
+    print(f"{'rows':>7}  {'mode':<13} {'seconds':>8} {'peak MB':>8} {'PDF KB':>8}")
+    for r in benchmark_pdf():
+        print(f"{r['rows']:>7}  {r['mode']:<13} {r['seconds']:>8} {r['peak_mb']:>8} {r['pdf_kb']:>8}")
+    return 0
+
+
+def _benchmark_login(db: Session) -> int:
+    print(
+        f"argon2 t={settings.argon2_time_cost} m={settings.argon2_memory_cost} "
+        f"p={settings.argon2_parallelism}, {os.cpu_count()} cores"
+    )
+    print(f"{'workers':>7} {'logins':>7} {'seconds':>8} {'ms each':>8} {'per sec':>8} {'per core':>9}")
+    for r in benchmark_login():
+        print(
+            f"{r['workers']:>7} {r['logins']:>7} {r['seconds']:>8} {r['ms_per_login']:>8} "
+            f"{r['per_second']:>8} {r['per_second_per_core']:>9}"
+        )
+    return 0
+
+
+COMMANDS = {
+    "rebuild-hierarchy": _rebuild_hierarchy,
+    "verify-hierarchy": _verify_hierarchy,
+    "check-indexes": _check_indexes,
+    "rebuild-search": _rebuild_search,
+    "repair-milestone-counters": _repair_milestone_counters,
+    "benchmark-pdf": _benchmark_pdf,
+    "benchmark-login": _benchmark_login,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Task manager admin commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+
+    with Session(engine) as db:
+        sys.exit(COMMANDS[args.command](db))
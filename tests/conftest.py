@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# Register every mapped class before create_all()
+import app.models.app_setting  # noqa: F401
+import app.models.milestone  # noqa: F401
+import app.models.privilege  # noqa: F401
+import app.models.quick_task  # noqa: F401
+import app.models.task  # noqa: F401
+import app.models.task_type  # noqa: F401
+import app.models.user  # noqa: F401
+import app.models.user_hierarchy  # noqa: F401
+import app.models.user_privilege  # noqa: F401
+from app.database import Base
+
+
+@pytest.fixture
+def engine():
+    # One shared in-memory SQLite connection with the full schema
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """
+    Session on an empty schema. Test modules that need data override
+    this fixture with one that requests it and seeds it.
+    """
+    with Session(engine) as session:
+        yield session
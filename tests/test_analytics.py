@@ -0,0 +1,91 @@
+import statistics
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.analytics_service import _grouped_quantiles, task_analytics
+from app.services.hierarchy_service import rebuild_hierarchy
+
+
+def test_grouped_quantiles_match_statistics():
+    groups = {
+        1: [0.5, 1.0, 2.0, 7.5, 9.0, 30.0],
+        2: [4.0],
+        3: [1.0, 3.0],
+        "IT": [2.0, 2.0, 5.0, 11.0, 12.5],
+    }
+    keys = []
+    values = []
+    for key, run in groups.items():
+        keys.extend([key] * len(run))
+        values.extend(sorted(run))
+
+    result = _grouped_quantiles(keys, values, (("median", 0.5), ("p90", 0.9)))
+
+    assert set(result) == set(groups)
+    for key, run in groups.items():
+        assert result[key]["median"] == pytest.approx(statistics.median(run))
+        if len(run) > 1:
+            p90 = statistics.quantiles(run, n=10, method="inclusive")[-1]
+        else:
+            p90 = run[0]
+        assert result[key]["p90"] == pytest.approx(p90)
+
+
+def test_grouped_quantiles_empty():
+    assert _grouped_quantiles([], [], (("median", 0.5),)) == {}
+
+
+@pytest.fixture
+def db(db):
+    admin = User(username="admin", password_hash="x", role="admin", department="IT")
+    manager = User(username="mgr", password_hash="x", role="manager", department="IT")
+    db.add_all([admin, manager])
+    db.flush()
+    staff = User(username="staff", password_hash="x", role="staff",
+                 department="IT", manager_id=manager.id)
+    task_type = TaskType(name="Report", department="IT")
+    db.add_all([staff, task_type])
+    db.flush()
+    rebuild_hierarchy(db)
+
+    created = datetime.utcnow() - timedelta(days=10)
+    for assignee, status in [
+        (staff, "In Progress"),
+        (staff, "Submitted for Review"),
+        (staff, "Completed"),
+        (manager, "In Progress"),
+        (manager, "Submitted for Review"),
+    ]:
+        db.add(Task(
+            title=f"{assignee.username} {status}",
+            type_id=task_type.id,
+            status=status,
+            assigned_to_id=assignee.id,
+            final_deadline=date.today(),
+            created_at=created,
+            completed_at=datetime.utcnow() if status == "Completed" else None
+        ))
+    db.commit()
+    return db
+
+
+def _totals(result):
+    return {group["label"]: group["total"] for group in result["groups"]}
+
+
+def test_task_analytics_follows_task_visibility(db):
+    admin = db.query(User).filter_by(username="admin").one()
+    manager = db.query(User).filter_by(username="mgr").one()
+    staff = db.query(User).filter_by(username="staff").one()
+
+    assert _totals(task_analytics(db, admin, {})) == {"staff": 3, "mgr": 2}
+    # Own tasks outside review, plus subordinates' tasks awaiting review
+    assert _totals(task_analytics(db, manager, {})) == {"mgr": 1, "staff": 1}
+    assert _totals(task_analytics(db, staff, {})) == {"staff": 2}
+
+    completed = task_analytics(db, staff, {})["groups"][0]["days_to_complete"]
+    assert completed["median"] == pytest.approx(10, abs=0.01)
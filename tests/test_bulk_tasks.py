@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.sql import Select
+
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.hierarchy_service import rebuild_hierarchy
+from app.services.task_service import bulk_update_tasks
+
+
+@pytest.fixture
+def db(db):
+    manager = User(username="mgr", password_hash="x", role="manager", department="IT")
+    db.add(manager)
+    db.flush()
+    staff = [
+        User(username=f"staff{i}", password_hash="x", role="staff",
+             department="IT", manager_id=manager.id)
+        for i in range(2)
+    ]
+    task_type = TaskType(name="Report", department="IT")
+    db.add_all([*staff, task_type])
+    db.flush()
+    rebuild_hierarchy(db)
+
+    for assignee in (manager, staff[0], staff[0]):
+        db.add(Task(
+            title=f"{assignee.username} task",
+            type_id=task_type.id,
+            status="Submitted for Review",
+            assigned_to_id=assignee.id,
+            final_deadline=date.today()
+        ))
+    db.commit()
+    return db
+
+
+def _user(db, username):
+    return db.query(User).filter_by(username=username).one()
+
+
+def test_bulk_review_skips_own_tasks(db):
+    manager = _user(db, "mgr")
+
+    result = bulk_update_tasks(db, manager, [1, 2, 3], "approve")
+
+    assert result["updated"] == 2
+    assert result["results"][0] == {"id": 1, "ok": False, "error": "not permitted"}
+    assert db.get(Task, 1).status == "Submitted for Review"
+
+
+def test_bulk_reassign_reports_concurrent_reassignment(db, monkeypatch):
+    manager = _user(db, "mgr")
+    other = _user(db, "staff1")
+    execute = db.execute
+    moved = []
+
+    def reassign_after_read(statement, *args, **kwargs):
+        result = execute(statement, *args, **kwargs)
+        if isinstance(statement, Select) and "tasks.archived" in str(statement) and not moved:
+            # Another request moves task 2 between the batched read and
+            # the UPDATE
+            moved.append(2)
+            execute(
+                update(Task)
+                .where(Task.id == 2)
+                .values(assigned_to_id=manager.id)
+                .execution_options(synchronize_session=False)
+            )
+        return result
+
+    monkeypatch.setattr(db, "execute", reassign_after_read)
+
+    result = bulk_update_tasks(db, manager, [2, 3], "reassign", other.id)
+
+    assert result["updated"] == 1
+    assert result["results"][0] == {"id": 2, "ok": False, "error": "changed by another request"}
+    db.expire_all()
+    assert db.get(Task, 2).assigned_to_id == manager.id
+    assert db.get(Task, 3).assigned_to_id == other.id
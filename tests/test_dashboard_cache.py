@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import dashboard_cache
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+
+    def build_dashboard(db, user):
+        calls.append("dashboard")
+        return {
+            **{section: {"tasks": [], "milestones": []} for section in ("today", "upcoming", "overdue")},
+            "pending_review": [],
+        }
+
+    def build_kpis(db, user):
+        calls.append("kpis")
+        return {"total_tasks": 0}
+
+    monkeypatch.setattr(dashboard_cache, "build_dashboard", build_dashboard)
+    monkeypatch.setitem(dashboard_cache._BUILDERS, "kpis", build_kpis)
+    dashboard_cache.clear_dashboard_cache()
+    yield calls
+    dashboard_cache.clear_dashboard_cache()
+
+
+def test_kpis_miss_skips_the_dashboard_build(builds):
+    user = SimpleNamespace(id=1, role="staff")
+
+    assert dashboard_cache.get_kpis_snapshot(None, user) == {"total_tasks": 0}
+    assert builds == ["kpis"]
+
+    # The full snapshot reuses the cached KPIs and only builds the rest
+    dashboard_cache.get_dashboard_snapshot(None, user)
+    assert builds == ["kpis", "dashboard"]
+
+    dashboard_cache.get_dashboard_snapshot(None, user)
+    dashboard_cache.get_kpis_snapshot(None, user)
+    assert builds == ["kpis", "dashboard"]
+
+
+def test_invalidation_drops_every_part(builds):
+    user = SimpleNamespace(id=1, role="staff")
+    dashboard_cache.get_dashboard_snapshot(None, user)
+
+    dashboard_cache.invalidate_users([user.id])
+    dashboard_cache.get_kpis_snapshot(None, user)
+
+    assert builds == ["dashboard", "kpis", "kpis"]
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+from app.models.app_setting import AppSetting
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.export_cache import DATA_VERSION_KEY, get_data_version
+
+
+@pytest.fixture
+def db(db):
+    db.add(AppSetting(key=DATA_VERSION_KEY, value="1"))
+    db.add(User(username="staff", password_hash="x", role="staff", department="IT"))
+    db.add(TaskType(name="Report", department="IT"))
+    db.commit()
+    return db
+
+
+def _bumped(db, change) -> bool:
+    before = get_data_version(db)
+    change(db)
+    db.commit()
+    return get_data_version(db) != before
+
+
+def _set(model, **values):
+    def change(db):
+        obj = db.query(model).one()
+        for name, value in values.items():
+            setattr(obj, name, value)
+    return change
+
+
+@pytest.mark.parametrize("model, values, bumps", [
+    (User, {"password_hash": "rehashed"}, False),
+    (User, {"department": "HR"}, False),
+    (User, {"username": "renamed"}, True),
+    (TaskType, {"department": "HR"}, False),
+    (TaskType, {"name": "Renamed"}, True),
+])
+def test_only_exported_columns_bump_the_version(db, model, values, bumps):
+    assert _bumped(db, _set(model, **values)) is bumps
+
+
+def test_task_writes_bump_the_version(db):
+    def add_task(db):
+        db.add(Task(
+            title="New",
+            type_id=db.query(TaskType).one().id,
+            final_deadline=date.today()
+        ))
+
+    assert _bumped(db, add_task)
+    assert not _bumped(db, lambda db: db.add(User(username="hire", password_hash="x", role="staff")))
@@ -0,0 +1,34 @@
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from app.services.export_jobs import _on_done
+
+
+def _job():
+    return SimpleNamespace(status="queued", finished_at=None, size=None, error=None)
+
+
+def test_cancelled_export_is_marked_cancelled():
+    job = _job()
+    future = Future()
+    future.add_done_callback(lambda f: _on_done(job, f))
+
+    assert future.cancel()
+
+    assert job.status == "cancelled"
+    assert job.error and job.finished_at is not None
+
+
+def test_finished_exports_record_result_or_error():
+    done, failed = _job(), _job()
+
+    future = Future()
+    future.add_done_callback(lambda f: _on_done(done, f))
+    future.set_result(123)
+
+    future = Future()
+    future.add_done_callback(lambda f: _on_done(failed, f))
+    future.set_exception(RuntimeError("disk full"))
+
+    assert (done.status, done.size) == ("done", 123)
+    assert (failed.status, failed.error) == ("failed", "disk full")
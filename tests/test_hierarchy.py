@@ -0,0 +1,135 @@
+import random
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.user import User
+from app.models.user_hierarchy import UserHierarchy
+from app.services.hierarchy_service import rebuild_hierarchy, set_manager, verify_hierarchy
+from app.utils.hierarchy import subordinate_ids_query
+
+
+@pytest.fixture
+def db(db):
+    # ceo -> (vp_a -> lead -> dev), (vp_b)
+    ceo = User(username="ceo", password_hash="x", role="admin")
+    db.add(ceo)
+    db.flush()
+    vp_a = User(username="vp_a", password_hash="x", role="manager", manager_id=ceo.id)
+    vp_b = User(username="vp_b", password_hash="x", role="manager", manager_id=ceo.id)
+    db.add_all([vp_a, vp_b])
+    db.flush()
+    lead = User(username="lead", password_hash="x", role="manager", manager_id=vp_a.id)
+    db.add(lead)
+    db.flush()
+    db.add(User(username="dev", password_hash="x", role="staff", manager_id=lead.id))
+    db.flush()
+    rebuild_hierarchy(db)
+    return db
+
+
+def _user(db, username):
+    return db.query(User).filter_by(username=username).one()
+
+
+def _below(db, username):
+    ids = db.execute(subordinate_ids_query(_user(db, username).id)).scalars()
+    return {db.get(User, i).username for i in ids}
+
+
+def _depth(db, ancestor, descendant):
+    return db.execute(
+        select(UserHierarchy.depth).where(
+            UserHierarchy.ancestor_id == _user(db, ancestor).id,
+            UserHierarchy.descendant_id == _user(db, descendant).id
+        )
+    ).scalar()
+
+
+def test_move_takes_the_whole_subtree(db):
+    assert set_manager(db, _user(db, "lead"), _user(db, "vp_b").id)
+    db.commit()
+
+    assert _below(db, "vp_a") == set()
+    assert _below(db, "vp_b") == {"lead", "dev"}
+    assert _below(db, "ceo") == {"vp_a", "vp_b", "lead", "dev"}
+    assert _depth(db, "ceo", "dev") == 3
+    assert verify_hierarchy(db)["ok"]
+
+    # Detaching makes the subtree a root of its own
+    assert set_manager(db, _user(db, "lead"), None)
+    db.commit()
+    assert _below(db, "ceo") == {"vp_a", "vp_b"}
+    assert _below(db, "lead") == {"dev"}
+    assert verify_hierarchy(db)["ok"]
+
+
+def test_cycles_are_rejected(db):
+    ceo = _user(db, "ceo")
+
+    assert not set_manager(db, ceo, _user(db, "dev").id)
+    assert not set_manager(db, ceo, ceo.id)
+    db.commit()
+
+    assert ceo.manager_id is None
+    assert _below(db, "ceo") == {"vp_a", "vp_b", "lead", "dev"}
+    assert verify_hierarchy(db)["ok"]
+
+
+def test_new_users_get_their_self_row(db):
+    hire = User(username="hire", password_hash="x", role="staff")
+    db.add(hire)
+    assert set_manager(db, hire, _user(db, "dev").id)
+
+    loner = User(username="loner", password_hash="x", role="staff")
+    db.add(loner)
+    assert set_manager(db, loner, None)
+    db.commit()
+
+    assert _depth(db, "hire", "hire") == 0
+    assert _depth(db, "loner", "loner") == 0
+    assert _depth(db, "ceo", "hire") == 4
+    assert "hire" in _below(db, "vp_a")
+    assert verify_hierarchy(db)["ok"]
+
+
+def test_rebuild_reports_existing_cycles(db):
+    # Corrupt users.manager_id directly: vp_a <-> lead
+    db.execute(
+        update(User)
+        .where(User.id == _user(db, "vp_a").id)
+        .values(manager_id=_user(db, "lead").id)
+    )
+    db.commit()
+
+    report = rebuild_hierarchy(db)
+    cyclic = {db.get(User, i).username for i in report["cyclic_user_ids"]}
+
+    assert {"vp_a", "lead"} <= cyclic
+    assert "vp_b" not in cyclic and "ceo" not in cyclic
+    # Users in the cycle keep only their own row; the rest is intact
+    assert _depth(db, "vp_a", "vp_a") == 0
+    assert _below(db, "vp_a") == set()
+    assert _below(db, "ceo") == {"vp_b"}
+
+    result = verify_hierarchy(db)
+    assert not result["ok"]
+    assert result["missing"] == [] and result["unexpected"] == []
+
+
+def test_random_moves_keep_the_closure_consistent(db):
+    rng = random.Random(4)
+    for i in range(10):
+        db.add(User(username=f"extra{i}", password_hash="x", role="staff"))
+    db.flush()
+    ids = list(db.execute(select(User.id)).scalars())
+
+    for _ in range(200):
+        user = db.get(User, rng.choice(ids))
+        manager_id = rng.choice(ids + [None])
+        set_manager(db, user, manager_id)
+    db.commit()
+
+    assert verify_hierarchy(db) == {
+        "ok": True, "missing": [], "unexpected": [], "cyclic_user_ids": []
+    }
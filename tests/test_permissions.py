@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.hierarchy_service import rebuild_hierarchy
+from app.utils.hierarchy import get_auth_context
+from app.utils.workflow import can_review_task
+
+
+@pytest.fixture
+def db(db):
+    admin = User(username="admin", password_hash="x", role="admin", department="IT")
+    manager = User(username="mgr", password_hash="x", role="manager", department="IT")
+    db.add_all([admin, manager])
+    db.flush()
+    staff = User(username="staff", password_hash="x", role="staff",
+                 department="IT", manager_id=manager.id)
+    task_type = TaskType(name="Report", department="IT")
+    db.add_all([staff, task_type])
+    db.flush()
+    rebuild_hierarchy(db)
+
+    for assignee in (admin, manager, staff):
+        db.add(Task(
+            title=f"{assignee.username} task",
+            type_id=task_type.id,
+            status="Submitted for Review",
+            assigned_to_id=assignee.id,
+            final_deadline=date.today()
+        ))
+    db.commit()
+    return db
+
+
+def _user(db, username):
+    return db.query(User).filter_by(username=username).one()
+
+
+def _task(db, username):
+    return db.query(Task).filter(Task.assigned_to_id == _user(db, username).id).one()
+
+
+@pytest.mark.parametrize("username", ["admin", "mgr", "staff"])
+def test_assignee_cannot_review_own_task(db, username):
+    user = _user(db, username)
+    assert not can_review_task(user, _task(db, username))
+
+
+def test_reviewers_are_admins_and_managers_above_the_assignee(db):
+    admin = _user(db, "admin")
+    manager = _user(db, "mgr")
+    staff = _user(db, "staff")
+
+    assert can_review_task(admin, _task(db, "mgr"))
+    assert can_review_task(manager, _task(db, "staff"))
+    assert not can_review_task(staff, _task(db, "mgr"))
+
+    tasks = db.query(Task).all()
+    assert get_auth_context(manager).reviewable_task_ids(tasks) == {_task(db, "staff").id}
+    # Editing stays open to the assignee
+    assert _task(db, "mgr").id in get_auth_context(manager).editable_task_ids(tasks)
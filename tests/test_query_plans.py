@@ -0,0 +1,118 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.milestone import TaskMilestone
+from app.models.quick_task import QuickTask
+from app.models.task import Task
+from app.models.task_type import TaskType
+from app.models.user import User
+from app.services.hierarchy_service import rebuild_hierarchy
+from app.services.query_plan_service import explain_hot_queries
+
+
+STATUSES = ["To Do", "In Progress", "Submitted for Review", "Approved", "Completed"]
+
+
+@pytest.fixture
+def db(db):
+    admin = User(username="admin", password_hash="x", role="admin", department="IT")
+    manager = User(username="mgr", password_hash="x", role="manager", department="IT")
+    db.add_all([admin, manager])
+    db.flush()
+    staff = [
+        User(username=f"staff{i}", password_hash="x", role="staff",
+             department="IT", manager_id=manager.id)
+        for i in range(5)
+    ]
+    task_type = TaskType(name="Report", department="IT")
+    db.add_all([*staff, task_type])
+    db.flush()
+    rebuild_hierarchy(db)
+
+    today = date.today()
+    for i in range(400):
+        task = Task(
+            title=f"Task {i}",
+            type_id=task_type.id,
+            status=STATUSES[i % len(STATUSES)],
+            priority="Normal",
+            assigned_to_id=staff[i % len(staff)].id if i % 7 else manager.id,
+            final_deadline=today + timedelta(days=i % 60 - 30),
+            archived=i % 4 == 0,
+            completed_at=(
+                datetime.utcnow() - timedelta(days=i % 90)
+                if i % len(STATUSES) == 4 else None
+            )
+        )
+        db.add(task)
+        db.flush()
+        db.add(TaskMilestone(
+            task_id=task.id,
+            title="Step",
+            deadline=task.final_deadline,
+            sequence=1,
+            status="Pending"
+        ))
+    for i in range(200):
+        db.add(QuickTask(
+            title=f"Log {i}",
+            completed_on=today - timedelta(days=i % 90),
+            created_by_id=staff[i % len(staff)].id
+        ))
+    db.commit()
+    return db
+
+
+def test_hot_queries_never_full_scan_task_tables(db):
+    results = explain_hot_queries(db)
+    assert results
+
+    scans = [(r["statement"], r["full_scans"]) for r in results if r["full_scans"]]
+    assert scans == []
+
+
+@pytest.mark.parametrize("index_name", [
+    "ix_tasks_live_deadline_id",
+    "ix_tasks_live_assignee_status_deadline",
+    "ix_tasks_live_status_deadline",
+    "ix_task_milestones_deadline_status",
+])
+def test_hot_queries_use_new_indexes(db, index_name):
+    plans = [line for r in explain_hot_queries(db) for line in r["plan"]]
+    assert any(
+        f"USING INDEX {index_name}" in line or f"USING COVERING INDEX {index_name}" in line
+        for line in plans
+    ), "\n".join(plans)
+
+
+def _plans_containing(db, fragment):
+    return [r["plan"] for r in explain_hot_queries(db) if fragment in r["statement"]]
+
+
+def test_report_list_union_reads_both_tables_by_index(db):
+    plans = _plans_containing(db, "UNION ALL")
+    assert plans
+
+    for plan in plans:
+        text = "\n".join(plan)
+        assert any(
+            line.startswith(("SCAN tasks USING", "SEARCH tasks USING"))
+            and "ix_tasks_live_" in line
+            for line in plan
+        ), text
+        assert any(
+            "quick_tasks USING COVERING INDEX ix_quick_tasks_completed_on" in line
+            for line in plan
+        ), text
+
+
+def test_weekly_completions_search_completed_at_index(db):
+    plans = _plans_containing(db, "tasks.completed_at >=")
+    assert plans
+
+    for plan in plans:
+        assert any(
+            line.startswith("SEARCH tasks USING INDEX ix_tasks_live_completed_at")
+            for line in plan
+        ), "\n".join(plan)